@@ -1,15 +1,22 @@
 """Agent implementations for contract analysis tasks."""
 
-from .base import BaseAgent
-from .risk_agent import RiskAnalysisAgent
-from .clause_agent import ClauseAlignmentAgent
-from .obligation_agent import ObligationTrackingAgent
-from .dependency_agent import DependencyGraphAgent
-
-__all__ = [
-    "BaseAgent",
-    "RiskAnalysisAgent",
-    "ClauseAlignmentAgent",
-    "ObligationTrackingAgent",
-    "DependencyGraphAgent",
-]
+from importlib import import_module
+from typing import Any
+
+# Agents are imported on first access so that SDKs used by one agent are
+# only loaded when that agent is actually needed
+_EXPORTS = {
+    "BaseAgent": ".base",
+    "RiskAnalysisAgent": ".risk_agent",
+    "ClauseAlignmentAgent": ".clause_agent",
+    "ObligationTrackingAgent": ".obligation_agent",
+    "DependencyGraphAgent": ".dependency_agent",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name], __name__), name)
@@ -1,8 +1,13 @@
 """Base agent class for all specialized contract analysis agents."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+from src.core.document import ContractSpan
+
+if TYPE_CHECKING:
+    from src.core.clause_index import ClauseIndex
 
 
 class AgentConfig(BaseModel):
@@ -17,9 +22,53 @@ class AgentConfig(BaseModel):
 
 
 class AgentInput(BaseModel):
-    """Base input for agent execution."""
+    """
+    Base input for agent execution.
+
+    contract_text may be a plain string or a ContractSpan over a shared
+    ContractDocument; spans are only decoded when the prompt is formatted.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    contract_text: Union[str, ContractSpan] = Field(
+        description="Contract text (or span) to analyze"
+    )
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+
+    @field_serializer("contract_text")
+    def serialize_contract_text(self, contract_text: Union[str, ContractSpan]) -> str:
+        """Materialize spans so span-backed inputs serialize like plain text."""
+        return str(contract_text)
+
+
+class ContractRecord(BaseModel):
+    """A single contract within a multi-contract input."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    contract_id: str = Field(description="Unique contract identifier")
+    contract_text: Union[str, ContractSpan] = Field(description="Contract text (or span)")
+    counterparty: Optional[str] = Field(default=None, description="Counterparty name")
+    clause_types: List[str] = Field(
+        default_factory=list,
+        description="Clause types present (derived from headings if empty)",
+    )
+    embedding: Optional[List[float]] = Field(
+        default=None, description="Contract-level embedding vector"
+    )
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
-    contract_text: str = Field(description="Contract text to analyze")
+    @field_serializer("contract_text")
+    def serialize_contract_text(self, contract_text: Union[str, ContractSpan]) -> str:
+        """Materialize spans so span-backed records serialize like plain text."""
+        return str(contract_text)
+
+
+class MultiContractInput(BaseModel):
+    """Input for portfolio-level analysis across several contracts."""
+
+    contracts: List[ContractRecord] = Field(description="Contracts to analyze together")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
 
@@ -82,6 +131,54 @@ class BaseAgent(ABC):
         """
         template = self.get_prompt_template()
         return template.format(
-            contract_text=input_data.contract_text,
+            contract_text=str(input_data.contract_text),
             **input_data.metadata
         )
+
+    async def analyze_with_reuse(
+        self,
+        input_data: AgentInput,
+        clause_index: "ClauseIndex",
+        key: Optional[str] = None,
+    ) -> AgentOutput:
+        """
+        Analyze a clause, reusing findings of an indexed near-duplicate if one exists.
+
+        Only near-duplicates with the same bare numbers (notice periods, caps,
+        rates) are reused. Reused outputs record their provenance under
+        ``metadata["reused_from"]``.
+        Fresh outputs are added to the index under ``key`` so later
+        near-duplicates can reuse them.
+
+        Args:
+            input_data: Clause text and metadata (``parties`` is used for normalization)
+            clause_index: Index of previously analyzed clauses
+            key: Key to index a fresh analysis under (not indexed if omitted)
+
+        Returns:
+            Reused or freshly computed analysis results
+        """
+        text = str(input_data.contract_text)
+        parties = input_data.metadata.get("parties")
+        matches = clause_index.query(
+            text, parties=parties, namespace=self.name, limit=1, match_numbers=True
+        )
+        if matches:
+            match = matches[0]
+            output = AgentOutput.model_validate(match.findings)
+            output.metadata = {
+                **output.metadata,
+                "reused_from": {
+                    "key": match.key,
+                    "similarity": match.similarity,
+                    "substitutions": match.substitutions,
+                },
+            }
+            return output
+
+        output = await self.analyze(input_data)
+        if key is not None:
+            clause_index.add(
+                key, text, output.model_dump(), parties=parties, namespace=self.name
+            )
+        return output
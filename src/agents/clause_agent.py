@@ -1,8 +1,12 @@
 """Clause Alignment Agent for ensuring consistency across contracts."""
 
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, List
+from src.core.document import ContractDocument, ContractSpan
 from .base import BaseAgent, AgentConfig, AgentInput, AgentOutput
 
+if TYPE_CHECKING:
+    from src.core.clause_index import ClauseIndex
+
 
 class ClauseAlignmentAgent(BaseAgent):
     """
@@ -13,8 +17,19 @@ class ClauseAlignmentAgent(BaseAgent):
     - Detecting conflicting terms across contract portfolio
     """
 
-    def __init__(self, config: AgentConfig | None = None):
-        """Initialize Clause Alignment Agent."""
+    def __init__(
+        self,
+        config: AgentConfig | None = None,
+        clause_index: "ClauseIndex | None" = None,
+    ):
+        """
+        Initialize Clause Alignment Agent.
+
+        Args:
+            config: Agent configuration
+            clause_index: Optional index of library/portfolio clauses used to
+                find standardization candidates
+        """
         if config is None:
             config = AgentConfig(
                 name="ClauseAlignmentAgent",
@@ -22,6 +37,48 @@ class ClauseAlignmentAgent(BaseAgent):
                 temperature=0.0,
             )
         super().__init__(config)
+        self.clause_index = clause_index
+
+    def find_standardization_candidates(self, input_data: AgentInput) -> List[Dict[str, Any]]:
+        """
+        Find clauses with near-duplicates in the clause index.
+
+        Near-duplicates that are not identical are cheap candidates for
+        standardization and are listed before any LLM call is made. Exact
+        matches are already standard and are skipped.
+
+        Args:
+            input_data: Contract text and metadata (``parties`` is used for normalization)
+
+        Returns:
+            One entry per contract clause with its closest indexed matches
+        """
+        if self.clause_index is None:
+            return []
+
+        parties = input_data.metadata.get("parties")
+        contract_text = input_data.contract_text
+        if isinstance(contract_text, ContractSpan):
+            clauses = contract_text.clauses()
+        else:
+            clauses = ContractDocument.from_text(contract_text).clauses()
+
+        candidates = []
+        for clause in clauses:
+            # The same clause may be indexed by several agents; keep the best match per key
+            best: Dict[str, float] = {}
+            for match in self.clause_index.query(clause.text(), parties=parties):
+                if match.similarity < 1.0:
+                    best[match.key] = max(best.get(match.key, 0.0), match.similarity)
+            if best:
+                candidates.append({
+                    "clause": clause.label,
+                    "matches": [
+                        {"key": key, "similarity": similarity}
+                        for key, similarity in sorted(best.items(), key=lambda item: -item[1])
+                    ],
+                })
+        return candidates
 
     async def analyze(self, input_data: AgentInput) -> AgentOutput:
         """
@@ -40,7 +97,8 @@ class ClauseAlignmentAgent(BaseAgent):
             "alignment_score": 0.0,
             "inconsistencies": [],
             "recommended_clauses": [],
-            "conflicts": []
+            "conflicts": [],
+            "standardization_candidates": self.find_standardization_candidates(input_data),
         }
 
         return AgentOutput(
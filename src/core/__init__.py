@@ -1,5 +1,21 @@
 """Core framework components for the multi-agent CLM system."""
 
-from .config import settings, Settings
+from importlib import import_module
+from typing import Any
 
-__all__ = ["settings", "Settings"]
+# Exports are resolved on first access so importing src.core stays cheap
+_EXPORTS = {
+    "settings": ".config",
+    "get_settings": ".config",
+    "Settings": ".config",
+    "ContractDocument": ".document",
+    "ContractSpan": ".document",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name], __name__), name)
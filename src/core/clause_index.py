@@ -0,0 +1,341 @@
+"""MinHash/LSH index for reusing analyses of near-duplicate clauses."""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+# Entity patterns replaced by placeholders before shingling, in application order
+MONTHS = (
+    "january|february|march|april|may|june|july|august|september|october|november|december"
+)
+ENTITY_PATTERNS: List[Tuple[str, re.Pattern[str]]] = [
+    ("date", re.compile(
+        rf"\b(?:(?:{MONTHS})\s+\d{{1,2}},?\s+\d{{4}}"
+        r"|\d{4}-\d{2}-\d{2}"
+        r"|\d{1,2}/\d{1,2}/\d{2,4})\b",
+        re.IGNORECASE,
+    )),
+    ("amount", re.compile(
+        r"(?:[$€£]\s?\d[\d,]*(?:\.\d+)?|\b\d[\d,]*(?:\.\d+)?\s?(?:USD|EUR|GBP|dollars|euros)\b)",
+        re.IGNORECASE,
+    )),
+]
+# Bare numbers and percentages (notice periods, caps, rates) carry the terms of
+# a clause: they are recorded but kept in the shingled text, and findings are
+# only reused if they are identical ("30" days vs. "section 30" is too
+# ambiguous to substitute safely).
+NUMBER_PATTERN = re.compile(r"\b\d+(?:[.,]\d+)*%?")
+TOKEN_PATTERN = re.compile(r"<[a-z]+>|\w+")
+
+# Entity kinds rewritten in reused findings
+SUBSTITUTED_KINDS = ("party", "date", "amount")
+
+# Prime just above 2**32; with 32-bit shingle hashes and coefficients, a * x + b fits in uint64
+HASH_PRIME = np.uint64(4294967311)
+
+
+class NormalizedClause(BaseModel):
+    """Clause text with parties, dates and amounts replaced by placeholders."""
+
+    text: str = Field(description="Normalized clause text")
+    entities: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description="Original entity values per kind, in order of first appearance",
+    )
+
+
+class ClauseMatch(BaseModel):
+    """A previously analyzed clause found to be a near-duplicate."""
+
+    key: str = Field(description="Key of the indexed clause")
+    namespace: str = Field(description="Namespace the clause was indexed under")
+    similarity: float = Field(ge=0.0, le=1.0, description="Estimated Jaccard similarity")
+    findings: Any = Field(default=None, description="Findings with entities substituted")
+    substitutions: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Entity values replaced in the reused findings (old -> new)",
+    )
+
+
+def normalize_clause(text: str, parties: Optional[Sequence[str]] = None) -> NormalizedClause:
+    """
+    Normalize a clause so templated variants produce the same shingles.
+
+    Args:
+        text: Clause text
+        parties: Party names to replace with <party>
+
+    Returns:
+        Normalized text and the entity values that were replaced
+    """
+    entities: Dict[str, List[str]] = {}
+
+    def replace(kind: str, pattern: re.Pattern[str], value: str) -> str:
+        values = entities.setdefault(kind, [])
+
+        def record(match: re.Match[str]) -> str:
+            if match.group(0) not in values:
+                values.append(match.group(0))
+            return f" <{kind}> "
+
+        return pattern.sub(record, value)
+
+    names = sorted({party for party in parties or [] if party}, key=len, reverse=True)
+    if names:
+        party_pattern = re.compile("|".join(re.escape(name) for name in names), re.IGNORECASE)
+        text = replace("party", party_pattern, text)
+    for kind, pattern in ENTITY_PATTERNS:
+        text = replace(kind, pattern, text)
+    entities["number"] = list(dict.fromkeys(NUMBER_PATTERN.findall(text)))
+
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    return NormalizedClause(
+        text=" ".join(tokens),
+        entities={kind: values for kind, values in entities.items() if values},
+    )
+
+
+def substitute_entities(findings: Any, substitutions: Dict[str, str]) -> Any:
+    """
+    Replace old entity values with new ones in every string of a findings structure.
+
+    Values are only replaced as whole tokens, so "1" never matches inside "11".
+    """
+    if not substitutions:
+        return findings
+    alternatives = "|".join(
+        re.escape(old) for old in sorted(substitutions, key=len, reverse=True)
+    )
+    pattern = re.compile(rf"(?<!\w)(?:{alternatives})(?!\w)")
+
+    def walk(value: Any) -> Any:
+        if isinstance(value, str):
+            return pattern.sub(lambda match: substitutions[match.group(0)], value)
+        if isinstance(value, dict):
+            return {key: walk(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(walk(item) for item in value)
+        return value
+
+    return walk(findings)
+
+
+EntryId = Tuple[str, str]  # (namespace, key)
+
+
+class ClauseIndex:
+    """
+    Locality-sensitive hashing index over MinHash signatures of clause shingles.
+
+    Signatures are split into ``bands`` bands of ``num_perm / bands`` rows;
+    clauses sharing any band bucket become candidates, and candidates are
+    kept only if their estimated Jaccard similarity reaches ``threshold``.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 3,
+        seed: int = 1,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity for a match
+            num_perm: Number of MinHash permutations
+            bands: Number of LSH bands (must divide num_perm)
+            shingle_size: Number of tokens per shingle
+            seed: Seed for the permutation coefficients
+        """
+        if num_perm % bands:
+            raise ValueError("bands must divide num_perm")
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2**32, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 2**32, size=num_perm, dtype=np.uint64)
+
+        # Entries are identified by (namespace, key) so several agents can
+        # index the same clause key without overwriting each other
+        self._buckets: Dict[Tuple[int, bytes], Set[EntryId]] = defaultdict(set)
+        self._signatures: Dict[EntryId, np.ndarray] = {}
+        self._entries: Dict[EntryId, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, entry_id: EntryId) -> bool:
+        return entry_id in self._entries
+
+    def _shingles(self, normalized: str) -> np.ndarray:
+        tokens = normalized.split()
+        size = min(self.shingle_size, len(tokens)) or 1
+        shingles = {" ".join(tokens[i:i + size]) for i in range(max(len(tokens) - size + 1, 1))}
+        return np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+
+    def signature(self, normalized: str) -> np.ndarray:
+        """Compute the MinHash signature of normalized clause text."""
+        hashes = self._shingles(normalized)
+        signature: np.ndarray = ((np.outer(hashes, self._a) + self._b) % HASH_PRIME).min(axis=0)
+        return signature
+
+    def _band_keys(self, signature: np.ndarray) -> Iterable[Tuple[int, bytes]]:
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def add(
+        self,
+        key: str,
+        text: str,
+        findings: Any,
+        parties: Optional[Sequence[str]] = None,
+        namespace: str = "default",
+    ) -> None:
+        """
+        Index an analyzed clause.
+
+        Args:
+            key: Unique clause key (e.g. "<contract_id>:<clause>")
+            text: Clause text
+            findings: Analysis results to reuse for near-duplicates
+            parties: Party names appearing in the clause
+            namespace: Separate findings of different agents; the same key may
+                be indexed once per namespace
+        """
+        entry_id = (namespace, key)
+        if entry_id in self._entries:
+            self.remove(key, namespace)
+        normalized = normalize_clause(text, parties)
+        signature = self.signature(normalized.text)
+        self._signatures[entry_id] = signature
+        self._entries[entry_id] = {
+            "entities": normalized.entities,
+            "findings": findings,
+        }
+        for band_key in self._band_keys(signature):
+            self._buckets[band_key].add(entry_id)
+
+    def remove(self, key: str, namespace: str = "default") -> None:
+        """Remove a clause from the index."""
+        entry_id = (namespace, key)
+        signature = self._signatures.pop(entry_id)
+        del self._entries[entry_id]
+        for band_key in self._band_keys(signature):
+            self._buckets[band_key].discard(entry_id)
+
+    def _candidates(self, signature: np.ndarray) -> Set[EntryId]:
+        candidates: Set[EntryId] = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self._buckets.get(band_key, ()))
+        return candidates
+
+    def query(
+        self,
+        text: str,
+        parties: Optional[Sequence[str]] = None,
+        namespace: Optional[str] = None,
+        limit: Optional[int] = None,
+        match_numbers: bool = False,
+    ) -> List[ClauseMatch]:
+        """
+        Find indexed near-duplicates of a clause.
+
+        Args:
+            text: Clause text
+            parties: Party names appearing in the clause
+            namespace: Only return clauses indexed under this namespace
+            limit: Maximum number of matches
+            match_numbers: Only return clauses whose bare numbers equal those of
+                the queried clause, so their findings can be reused verbatim
+
+        Returns:
+            Matches above the threshold, most similar first, with findings
+            rewritten to the entities of the queried clause
+        """
+        normalized = normalize_clause(text, parties)
+        signature = self.signature(normalized.text)
+
+        matches = []
+        for entry_id in self._candidates(signature):
+            entry_namespace, key = entry_id
+            if namespace is not None and entry_namespace != namespace:
+                continue
+            similarity = float(np.mean(self._signatures[entry_id] == signature))
+            if similarity < self.threshold:
+                continue
+            entry = self._entries[entry_id]
+            if match_numbers and (
+                entry["entities"].get("number", []) != normalized.entities.get("number", [])
+            ):
+                continue
+            substitutions = {
+                old: new
+                for kind in SUBSTITUTED_KINDS
+                for old, new in zip(
+                    entry["entities"].get(kind, []), normalized.entities.get(kind, [])
+                )
+                if old != new
+            }
+            matches.append(ClauseMatch(
+                key=key,
+                namespace=entry_namespace,
+                similarity=similarity,
+                findings=substitute_entities(entry["findings"], substitutions),
+                substitutions=substitutions,
+            ))
+
+        matches.sort(key=lambda match: (-match.similarity, match.key, match.namespace))
+        return matches[:limit] if limit is not None else matches
+
+    def candidate_pairs(self, namespace: Optional[str] = None) -> List[Tuple[str, str, float]]:
+        """
+        List pairs of indexed clauses that are near-duplicates of each other.
+
+        Only clauses of the same namespace are compared; a key pair indexed
+        under several namespaces is reported once.
+
+        Args:
+            namespace: Restrict to clauses of one namespace
+
+        Returns:
+            (key, key, estimated similarity) tuples above the threshold
+        """
+        seen: Set[Tuple[str, str]] = set()
+        pairs = []
+        for entry_ids in self._buckets.values():
+            if len(entry_ids) < 2:
+                continue
+            ordered = sorted(
+                entry_id for entry_id in entry_ids
+                if namespace is None or entry_id[0] == namespace
+            )
+            for i, first in enumerate(ordered):
+                for second in ordered[i + 1:]:
+                    key_pair = (first[1], second[1])
+                    if first[0] != second[0] or key_pair in seen:
+                        continue
+                    similarity = float(
+                        np.mean(self._signatures[first] == self._signatures[second])
+                    )
+                    if similarity >= self.threshold:
+                        seen.add(key_pair)
+                        pairs.append((*key_pair, similarity))
+        pairs.sort(key=lambda pair: (-pair[2], pair[0], pair[1]))
+        return pairs
@@ -1,6 +1,7 @@
 """Configuration management for the multi-agent CLM system."""
 
-from typing import Literal
+from functools import lru_cache
+from typing import Any, Literal
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -54,9 +55,30 @@ class Settings(BaseSettings):
     # Agent Configuration
     enable_risk_agent: bool = Field(default=True, description="Enable Risk Analysis Agent")
     enable_clause_agent: bool = Field(default=True, description="Enable Clause Alignment Agent")
-    enable_obligation_agent: bool = Field(default=True, description="Enable Obligation Tracking Agent")
+    enable_obligation_agent: bool = Field(
+        default=True,
+        description="Enable Obligation Tracking Agent"
+    )
     enable_dependency_agent: bool = Field(default=True, description="Enable Dependency Graph Agent")
 
+    # Scheduling
+    llm_max_concurrency: int = Field(
+        default=4,
+        description="Maximum concurrent LLM-bound agent calls"
+    )
+    interactive_reserved_slots: int = Field(
+        default=1,
+        description="LLM slots reserved for interactive requests"
+    )
+    interactive_slo_seconds: float = Field(
+        default=10.0,
+        description="Target queue time for interactive requests"
+    )
+    bulk_shed_policy: Literal["reject", "defer"] = Field(
+        default="defer",
+        description="Handling of bulk work while the interactive SLO is at risk"
+    )
+
     # Vector Database
     embedding_model: str = Field(
         default="text-embedding-3-small",
@@ -82,5 +104,19 @@ class Settings(BaseSettings):
         return [fmt.strip() for fmt in self.supported_formats.split(",")]
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide settings, loading them from the environment on first use.
+
+    Settings are not created at import time so that importing the package
+    stays cheap and does not read ``.env``.
+    """
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy module-level ``settings`` instance lazily."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,247 @@
+"""Portfolio-level cross-contract conflict detection with candidate pair blocking."""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field, computed_field
+
+from src.agents.base import AgentInput, AgentOutput, BaseAgent, ContractRecord, MultiContractInput
+from src.agents.clause_agent import ClauseAlignmentAgent
+from src.core.document import CLAUSE_HEADING_PATTERN, ContractSpan
+
+logger = logging.getLogger(__name__)
+
+Pair = Tuple[int, int]
+
+
+class BlockingReport(BaseModel):
+    """How much blocking reduced the all-pairs comparison."""
+
+    num_contracts: int = Field(description="Number of contracts in the portfolio")
+    total_pairs: int = Field(description="Pairs an all-pairs comparison would run")
+    counterparty_pairs: int = Field(description="Pairs sharing a counterparty")
+    embedding_pairs: int = Field(description="Pairs that are embedding neighbours")
+    candidate_pairs: int = Field(description="Pairs surviving all blocking rules")
+    unclassified_contracts: int = Field(
+        default=0,
+        description="Contracts without known clause types (matched as wildcards)",
+    )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def reduction_ratio(self) -> float:
+        """Fraction of all pairs that were pruned."""
+        if self.total_pairs == 0:
+            return 0.0
+        return 1.0 - self.candidate_pairs / self.total_pairs
+
+
+class PairResult(BaseModel):
+    """Conflict analysis of one candidate pair."""
+
+    contract_ids: Tuple[str, str] = Field(description="The two compared contracts")
+    shared_clause_types: List[str] = Field(
+        description="Clause types present in both contracts (empty if either is unclassified)"
+    )
+    output: AgentOutput = Field(description="Agent output for the pair")
+
+
+class ConflictDetectionResult(BaseModel):
+    """Result of portfolio conflict detection."""
+
+    report: BlockingReport = Field(description="Blocking statistics")
+    pairs: List[PairResult] = Field(default_factory=list, description="Per-pair results")
+
+
+def normalize_clause_type(title: str) -> str:
+    """Normalize a clause heading to a clause type key, e.g. "PAYMENT TERMS" -> "payment_terms"."""
+    return "_".join(title.lower().replace("&", " and ").split())
+
+
+def extract_clause_types(record: ContractRecord) -> Set[str]:
+    """Return the record's clause types, deriving them from numbered headings if not given."""
+    if record.clause_types:
+        return {normalize_clause_type(clause_type) for clause_type in record.clause_types}
+    contract_text = record.contract_text
+    if isinstance(contract_text, ContractSpan):
+        # Scan the shared document buffer in place instead of copying the text
+        matches = contract_text.document.finditer(
+            CLAUSE_HEADING_PATTERN, contract_text.start, contract_text.end
+        )
+    else:
+        matches = CLAUSE_HEADING_PATTERN.finditer(contract_text.encode("utf-8"))
+    return {normalize_clause_type(match.group(2).decode("utf-8")) for match in matches}
+
+
+def _block_pairs(keys: Iterable[Optional[str]]) -> Set[Pair]:
+    """All pairs of positions that share a non-empty key."""
+    blocks: Dict[str, List[int]] = defaultdict(list)
+    for position, key in enumerate(keys):
+        if key:
+            blocks[key].append(position)
+    pairs = set()
+    for members in blocks.values():
+        for i, first in enumerate(members):
+            for second in members[i + 1:]:
+                pairs.add((first, second))
+    return pairs
+
+
+def embedding_neighbour_pairs(
+    embeddings: List[Optional[List[float]]],
+    top_k: int = 5,
+    min_similarity: float = 0.7,
+    batch_size: int = 1024,
+) -> Set[Pair]:
+    """
+    Pair each contract with its top-k cosine neighbours.
+
+    Args:
+        embeddings: One vector per contract (None for contracts without one)
+        top_k: Neighbours considered per contract
+        min_similarity: Minimum cosine similarity for a neighbour
+        batch_size: Rows scored per matrix multiplication
+
+    Returns:
+        Pairs (i, j) with i < j
+    """
+    positions = [i for i, vector in enumerate(embeddings) if vector is not None]
+    if len(positions) < 2 or top_k <= 0:
+        return set()
+
+    matrix = np.asarray([embeddings[i] for i in positions], dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix /= np.where(norms == 0, 1.0, norms)
+    k = min(top_k, len(positions) - 1)
+
+    pairs = set()
+    for start in range(0, len(positions), batch_size):
+        scores = matrix[start:start + batch_size] @ matrix.T
+        rows = np.arange(scores.shape[0])
+        scores[rows, rows + start] = -np.inf
+        neighbours = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        for row, columns in enumerate(neighbours):
+            for column in columns:
+                if scores[row, column] >= min_similarity:
+                    first, second = positions[start + row], positions[column]
+                    pairs.add((min(first, second), max(first, second)))
+    return pairs
+
+
+class ConflictDetectionPipeline:
+    """
+    Detect conflicting terms across a contract portfolio.
+
+    Instead of comparing every contract with every other one, candidate pairs
+    are those that share a counterparty or are embedding neighbours, and that
+    also share at least one clause type. Contracts whose clause types are
+    unknown (no types given and no numbered headings found) match any clause
+    type, so missing metadata never silently drops a pair. Only surviving
+    pairs are sent to the agent, with at most ``max_concurrency`` pairs in
+    flight.
+    """
+
+    def __init__(
+        self,
+        agent: Optional[BaseAgent] = None,
+        max_concurrency: int = 4,
+        top_k: int = 5,
+        min_similarity: float = 0.7,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            agent: Agent used to compare a pair (defaults to ClauseAlignmentAgent)
+            max_concurrency: Maximum number of pairs analyzed concurrently
+            top_k: Embedding neighbours considered per contract
+            min_similarity: Minimum cosine similarity for embedding neighbours
+        """
+        self.agent = agent or ClauseAlignmentAgent()
+        self.max_concurrency = max_concurrency
+        self.top_k = top_k
+        self.min_similarity = min_similarity
+
+    def block(
+        self, portfolio: MultiContractInput
+    ) -> Tuple[List[Tuple[Pair, List[str]]], BlockingReport]:
+        """
+        Compute candidate pairs.
+
+        Args:
+            portfolio: Contracts to compare
+
+        Returns:
+            Candidate pairs with their shared clause types, and the blocking report
+        """
+        contracts = portfolio.contracts
+        counterparty_pairs = _block_pairs(
+            (record.counterparty or "").strip().lower() for record in contracts
+        )
+        embedding_pairs = embedding_neighbour_pairs(
+            [record.embedding for record in contracts],
+            top_k=self.top_k,
+            min_similarity=self.min_similarity,
+        )
+        clause_types = [extract_clause_types(record) for record in contracts]
+
+        candidates = []
+        for first, second in sorted(counterparty_pairs | embedding_pairs):
+            shared = sorted(clause_types[first] & clause_types[second])
+            if shared or not clause_types[first] or not clause_types[second]:
+                candidates.append(((first, second), shared))
+
+        n = len(contracts)
+        report = BlockingReport(
+            num_contracts=n,
+            total_pairs=n * (n - 1) // 2,
+            counterparty_pairs=len(counterparty_pairs),
+            embedding_pairs=len(embedding_pairs),
+            candidate_pairs=len(candidates),
+            unclassified_contracts=sum(not types for types in clause_types),
+        )
+        return candidates, report
+
+    async def run(self, portfolio: MultiContractInput) -> ConflictDetectionResult:
+        """
+        Block candidate pairs and analyze the survivors in parallel.
+
+        Args:
+            portfolio: Contracts to compare
+
+        Returns:
+            Per-pair agent outputs and blocking statistics
+        """
+        candidates, report = self.block(portfolio)
+        logger.info(
+            f"Blocking kept {report.candidate_pairs} of {report.total_pairs} pairs "
+            f"({report.reduction_ratio:.1%} reduction)"
+        )
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        contracts = portfolio.contracts
+
+        async def analyze_pair(pair: Pair, shared: List[str]) -> PairResult:
+            first, second = contracts[pair[0]], contracts[pair[1]]
+            agent_input = AgentInput(
+                contract_text=first.contract_text,
+                metadata={
+                    **portfolio.metadata,
+                    "contract_id": first.contract_id,
+                    "related_contract_ids": [second.contract_id],
+                    "related_contracts": second.contract_text,
+                    "shared_clause_types": shared,
+                },
+            )
+            async with semaphore:
+                output = await self.agent.analyze(agent_input)
+            return PairResult(
+                contract_ids=(first.contract_id, second.contract_id),
+                shared_clause_types=shared,
+                output=output,
+            )
+
+        pairs = await asyncio.gather(*(analyze_pair(pair, shared) for pair, shared in candidates))
+        return ConflictDetectionResult(report=report, pairs=list(pairs))
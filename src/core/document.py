@@ -0,0 +1,226 @@
+"""Span-based contract documents backed by memory-mapped files or shared buffers."""
+
+import mmap
+import re
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+
+# Numbered section headings such as "3. LIABILITY" or "12. GOVERNING LAW"
+CLAUSE_HEADING_PATTERN = re.compile(
+    rb"(?m)^[ \t]*(\d+(?:\.\d+)*)\.?[ \t]+([A-Z][A-Z0-9 ,&/'()-]*)[ \t]*\r?$"
+)
+
+
+class ContractSpan:
+    """
+    Lightweight view over a byte range of a contract document.
+
+    Spans only hold offsets into the parent document; the text is decoded
+    when the span is materialized (e.g. while formatting a prompt).
+    """
+
+    __slots__ = ("document", "start", "end", "label")
+
+    def __init__(
+        self,
+        document: "ContractDocument",
+        start: int,
+        end: int,
+        label: Optional[str] = None,
+    ):
+        """
+        Initialize the span.
+
+        Args:
+            document: Document the offsets refer to
+            start: Start byte offset (inclusive)
+            end: End byte offset (exclusive)
+            label: Optional label, e.g. the clause number
+        """
+        if not 0 <= start <= end <= len(document):
+            raise ValueError(f"Invalid span [{start}, {end}) for document of size {len(document)}")
+        self.document = document
+        self.start = start
+        self.end = end
+        self.label = label
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __str__(self) -> str:
+        return self.text()
+
+    def __repr__(self) -> str:
+        return f"ContractSpan(start={self.start}, end={self.end}, label={self.label!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ContractSpan):
+            return NotImplemented
+        return (
+            self.document is other.document
+            and self.start == other.start
+            and self.end == other.end
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.document), self.start, self.end))
+
+    def text(self) -> str:
+        """Decode and return the text covered by this span."""
+        return self.document.decode(self.start, self.end)
+
+    def clauses(self) -> List["ContractSpan"]:
+        """Split this span into clause spans (see ContractDocument.clauses)."""
+        return self.document.clauses(start=self.start, end=self.end)
+
+    def chunks(self, chunk_size: int = 1000, chunk_overlap: int = 200) -> Iterator["ContractSpan"]:
+        """Split this span into overlapping sub-spans (see ContractDocument.chunks)."""
+        return self.document.chunks(chunk_size, chunk_overlap, start=self.start, end=self.end)
+
+
+class ContractDocument:
+    """
+    UTF-8 contract text held in a memory-mapped file or a shared buffer.
+
+    Clauses and chunks are returned as ContractSpan objects so that large
+    documents are never copied into per-chunk strings up front.
+    """
+
+    def __init__(
+        self,
+        buffer: Union[bytes, bytearray, memoryview, mmap.mmap],
+        source: str = "<buffer>",
+    ):
+        """
+        Initialize the document.
+
+        Args:
+            buffer: UTF-8 encoded contract text
+            source: Human readable origin of the buffer (file path, upload id, ...)
+        """
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self.source = source
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "ContractDocument":
+        """
+        Memory-map a UTF-8 text file.
+
+        Args:
+            path: Path to the extracted contract text
+
+        Returns:
+            Document backed by a read-only mmap of the file
+        """
+        path = Path(path)
+        with open(path, "rb") as handle:
+            if path.stat().st_size == 0:
+                return cls(b"", source=str(path))
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, source=str(path))
+
+    @classmethod
+    def from_text(cls, text: str, source: str = "<text>") -> "ContractDocument":
+        """Create a document from an in-memory string."""
+        return cls(text.encode("utf-8"), source=source)
+
+    def __len__(self) -> int:
+        return self._view.nbytes
+
+    def __enter__(self) -> "ContractDocument":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the underlying buffer (closes the mmap if file-backed)."""
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def decode(self, start: int, end: int) -> str:
+        """Decode the bytes in [start, end) as UTF-8."""
+        return str(self._view[start:end], "utf-8", errors="replace")
+
+    def span(
+        self, start: int = 0, end: Optional[int] = None, label: Optional[str] = None
+    ) -> ContractSpan:
+        """Return a span over [start, end); defaults to the whole document."""
+        return ContractSpan(self, start, len(self) if end is None else end, label)
+
+    def _align(self, pos: int) -> int:
+        """Move pos back to the start of a UTF-8 character."""
+        while 0 < pos < len(self) and 0x80 <= self._view[pos] < 0xC0:
+            pos -= 1
+        return pos
+
+    def chunks(
+        self,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> Iterator[ContractSpan]:
+        """
+        Yield fixed-size overlapping chunks as spans.
+
+        Sizes are measured in bytes; chunk boundaries are moved back to the
+        nearest UTF-8 character start so every chunk decodes cleanly.
+
+        Args:
+            chunk_size: Maximum chunk size in bytes
+            chunk_overlap: Overlap between consecutive chunks in bytes
+            start: Start offset of the region to chunk
+            end: End offset of the region to chunk (defaults to document end)
+
+        Yields:
+            Chunk spans in document order
+        """
+        if chunk_overlap >= chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+        end = len(self) if end is None else end
+        pos = start
+        while pos < end:
+            stop = min(pos + chunk_size, end)
+            if stop < end:
+                stop = max(self._align(stop), pos + 1)
+            yield ContractSpan(self, pos, stop)
+            if stop >= end:
+                break
+            pos = max(self._align(stop - chunk_overlap), pos + 1)
+
+    def finditer(
+        self, pattern: "re.Pattern[bytes]", start: int = 0, end: Optional[int] = None
+    ) -> Iterator["re.Match[bytes]"]:
+        """Run a bytes pattern over [start, end) of the buffer without copying it."""
+        return pattern.finditer(self._view, start, len(self) if end is None else end)
+
+    def clauses(self, start: int = 0, end: Optional[int] = None) -> List[ContractSpan]:
+        """
+        Split the document (or the range [start, end)) into clause spans at
+        numbered section headings.
+
+        Args:
+            start: Start offset of the region to split
+            end: End offset of the region to split (defaults to document end)
+
+        Returns:
+            One span per heading, labelled with the clause number. Text before
+            the first heading (the preamble) is returned with label "preamble".
+        """
+        end = len(self) if end is None else end
+        headings = list(self.finditer(CLAUSE_HEADING_PATTERN, start, end))
+        if not headings:
+            return [ContractSpan(self, start, end, "preamble")] if end > start else []
+
+        spans: List[ContractSpan] = []
+        first = headings[0].start()
+        if self._view[start:first].tobytes().strip():
+            spans.append(ContractSpan(self, start, first, "preamble"))
+        for current, following in zip(headings, headings[1:] + [None]):
+            stop = following.start() if following is not None else end
+            label = current.group(1).decode("ascii")
+            spans.append(ContractSpan(self, current.start(), stop, label))
+        return spans
@@ -0,0 +1,258 @@
+"""Columnar Parquet store for agent outputs, partitioned by run and contract."""
+
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from urllib.parse import quote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from src.agents.base import AgentOutput
+
+# Partition keys are encoded in the directory layout, not stored in the files
+PARTITIONING = ds.partitioning(
+    pa.schema([("run_id", pa.string()), ("contract_id", pa.string())]),
+    flavor="hive",
+)
+
+TABLE_SCHEMAS: Dict[str, pa.Schema] = {
+    "risks": pa.schema([
+        ("agent_name", pa.string()),
+        ("category", pa.string()),  # red_flag, liability_gap, recommendation
+        ("risk_type", pa.string()),
+        ("description", pa.string()),
+        ("clause_reference", pa.string()),
+        ("severity", pa.string()),
+    ]),
+    "obligations": pa.schema([
+        ("agent_name", pa.string()),
+        ("description", pa.string()),
+        ("deadline", pa.string()),
+        ("responsible_party", pa.string()),
+        ("priority", pa.string()),
+        ("status", pa.string()),
+    ]),
+    "graph_edges": pa.schema([
+        ("agent_name", pa.string()),
+        ("source", pa.string()),
+        ("target", pa.string()),
+        ("relationship_type", pa.string()),
+        ("strength", pa.float64()),
+    ]),
+    "agent_runs": pa.schema([
+        ("agent_name", pa.string()),
+        ("confidence", pa.float64()),
+        ("reasoning", pa.string()),
+        ("risk_level", pa.string()),
+        ("duration_ms", pa.float64()),
+        ("created_at", pa.timestamp("us", tz="UTC")),
+    ]),
+}
+
+# Result keys of RiskAnalysisAgent mapped to the risks.category column
+RISK_CATEGORIES = {
+    "red_flags": "red_flag",
+    "liability_gaps": "liability_gap",
+    "recommendations": "recommendation",
+}
+
+Filters = List[Tuple[str, str, Any]]
+
+
+def _as_item(item: Any, text_key: str) -> Dict[str, Any]:
+    """Normalize a finding that may be a plain string or a dict."""
+    if isinstance(item, Mapping):
+        return dict(item)
+    return {text_key: str(item)}
+
+
+def _as_str(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _as_float(value: Any) -> Optional[float]:
+    try:
+        return None if value is None else float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def flatten_output(output: Union[AgentOutput, Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Flatten one agent output into rows for each columnar table.
+
+    Args:
+        output: AgentOutput or its model_dump() dict
+
+    Returns:
+        Mapping of table name to the rows contributed by this output
+    """
+    if isinstance(output, AgentOutput):
+        output = output.model_dump()
+
+    agent_name = output["agent_name"]
+    result = output.get("result", {}) or {}
+    metadata = output.get("metadata", {}) or {}
+    rows: Dict[str, List[Dict[str, Any]]] = {name: [] for name in TABLE_SCHEMAS}
+
+    for key, category in RISK_CATEGORIES.items():
+        for raw in result.get(key, []) or []:
+            item = _as_item(raw, "description")
+            rows["risks"].append({
+                "agent_name": agent_name,
+                "category": category,
+                "risk_type": _as_str(item.get("type", item.get("risk_type"))),
+                "description": _as_str(item.get("description")),
+                "clause_reference": _as_str(item.get("clause_reference", item.get("clause"))),
+                "severity": _as_str(item.get("severity")),
+            })
+
+    for raw in result.get("obligations", []) or []:
+        item = _as_item(raw, "description")
+        rows["obligations"].append({
+            "agent_name": agent_name,
+            "description": _as_str(item.get("description")),
+            "deadline": _as_str(item.get("deadline")),
+            "responsible_party": _as_str(item.get("responsible_party", item.get("party"))),
+            "priority": _as_str(item.get("priority")),
+            "status": _as_str(item.get("status", item.get("tracking_status"))),
+        })
+
+    for raw in result.get("edges", []) or []:
+        item = _as_item(raw, "relationship_type")
+        rows["graph_edges"].append({
+            "agent_name": agent_name,
+            "source": _as_str(item.get("source")),
+            "target": _as_str(item.get("target")),
+            "relationship_type": _as_str(item.get("relationship_type", item.get("type"))),
+            "strength": _as_float(item.get("strength")),
+        })
+
+    rows["agent_runs"].append({
+        "agent_name": agent_name,
+        "confidence": _as_float(output.get("confidence")),
+        "reasoning": _as_str(output.get("reasoning")),
+        "risk_level": _as_str(result.get("risk_level")),
+        "duration_ms": _as_float(metadata.get("duration_ms")),
+        "created_at": datetime.now(timezone.utc),
+    })
+    return rows
+
+
+class ResultStore:
+    """
+    Append-only columnar store for contract analysis results.
+
+    Layout: ``<root>/<table>/run_id=<run>/contract_id=<contract>/part-<uuid>.parquet``.
+    Every append writes new part files, so concurrent writers never touch
+    each other's data, and reads prune partitions and row groups using the
+    supplied filters.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory holding one sub-directory per table
+        """
+        self.root = Path(root)
+
+    def _partition_dir(self, table: str, run_id: str, contract_id: str) -> Path:
+        return (
+            self.root
+            / table
+            / f"run_id={quote(run_id, safe='')}"
+            / f"contract_id={quote(contract_id, safe='')}"
+        )
+
+    def append(
+        self,
+        run_id: str,
+        contract_id: str,
+        outputs: Union[Mapping[str, Union[AgentOutput, Dict[str, Any]]], Sequence[AgentOutput]],
+    ) -> Dict[str, int]:
+        """
+        Flatten and append the agent outputs of one contract analysis.
+
+        Args:
+            run_id: Identifier of the analysis run (e.g. a batch re-run)
+            contract_id: Identifier of the analyzed contract
+            outputs: Result of analyze_contract() or a list of AgentOutputs
+
+        Returns:
+            Number of rows written per table
+        """
+        items: Sequence[Union[AgentOutput, Dict[str, Any]]] = (
+            list(outputs.values()) if isinstance(outputs, Mapping) else outputs
+        )
+
+        rows: Dict[str, List[Dict[str, Any]]] = {name: [] for name in TABLE_SCHEMAS}
+        for output in items:
+            for table, table_rows in flatten_output(output).items():
+                rows[table].extend(table_rows)
+
+        written = {}
+        for table, table_rows in rows.items():
+            written[table] = len(table_rows)
+            if not table_rows:
+                continue
+            directory = self._partition_dir(table, run_id, contract_id)
+            directory.mkdir(parents=True, exist_ok=True)
+            arrow_table = pa.Table.from_pylist(table_rows, schema=TABLE_SCHEMAS[table])
+            pq.write_table(arrow_table, directory / f"part-{uuid.uuid4().hex}.parquet")
+        return written
+
+    def read(
+        self,
+        table: str,
+        filters: Optional[Filters] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Scan a table with predicate pushdown.
+
+        Args:
+            table: One of "risks", "obligations", "graph_edges", "agent_runs"
+            filters: Conjunction of (column, op, value) predicates; run_id and
+                contract_id filters prune whole partitions
+            columns: Columns to load (defaults to all, including partition keys)
+
+        Returns:
+            Matching rows as a DataFrame
+        """
+        if table not in TABLE_SCHEMAS:
+            raise ValueError(f"Unknown table '{table}'. Expected one of {sorted(TABLE_SCHEMAS)}")
+
+        schema = TABLE_SCHEMAS[table]
+        for field in PARTITIONING.schema:
+            schema = schema.append(field)
+
+        directory = self.root / table
+        if not directory.exists():
+            return schema.empty_table().to_pandas()
+
+        dataset = ds.dataset(directory, format="parquet", partitioning=PARTITIONING, schema=schema)
+        expression = pq.filters_to_expression(filters) if filters else None
+        return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+    def contracts_with_risk(self, risk_type: str, run_id: Optional[str] = None) -> List[str]:
+        """
+        List contracts with a given risk type, e.g. "unlimited_liability".
+
+        Args:
+            risk_type: Value of the risks.risk_type column
+            run_id: Restrict to a single run
+
+        Returns:
+            Sorted distinct contract ids
+        """
+        filters: Filters = [("risk_type", "==", risk_type)]
+        if run_id is not None:
+            filters.append(("run_id", "==", run_id))
+        frame = self.read("risks", filters=filters, columns=["contract_id"])
+        return sorted(frame["contract_id"].unique().tolist())
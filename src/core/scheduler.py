@@ -0,0 +1,377 @@
+"""Priority scheduling and load shedding for LLM-bound agent calls."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from enum import Enum
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(str, Enum):
+    """Traffic classes served by the scheduler."""
+
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+class LoadShedError(RuntimeError):
+    """Raised when a job is rejected by admission control."""
+
+
+class ClassMetrics(BaseModel):
+    """Counters for one priority class."""
+
+    queue_depth: int = Field(default=0, description="Jobs waiting for a slot")
+    deferred: int = Field(default=0, description="Bulk jobs held back by admission control")
+    running: int = Field(default=0, description="Jobs currently holding a slot")
+    admitted: int = Field(default=0, description="Jobs accepted since start")
+    completed: int = Field(default=0, description="Jobs finished since start")
+    cancelled: int = Field(default=0, description="Running jobs cancelled by their caller")
+    shed: int = Field(default=0, description="Jobs rejected since start")
+    deferred_total: int = Field(default=0, description="Jobs deferred at least once since start")
+
+
+class SchedulerMetrics(BaseModel):
+    """Snapshot of scheduler state."""
+
+    max_concurrency: int = Field(description="Total LLM concurrency")
+    estimated_service_seconds: float = Field(description="Moving average of job duration")
+    predicted_interactive_wait: float = Field(
+        description="Predicted queue time of a new interactive job"
+    )
+    classes: Dict[Priority, ClassMetrics] = Field(description="Per-class counters")
+
+
+class _Job:
+    __slots__ = ("fn", "priority", "future", "deadline")
+
+    def __init__(
+        self,
+        fn: Callable[[], Awaitable[Any]],
+        priority: Priority,
+        future: asyncio.Future,
+        deadline: Optional[float],
+    ):
+        self.fn = fn
+        self.priority = priority
+        self.future = future
+        self.deadline = deadline
+
+
+def _propagate_cancel(task: "asyncio.Task[None]", future: "asyncio.Future[Any]") -> None:
+    """Cancel a running job's task once its caller has cancelled the job's future."""
+    if future.cancelled():
+        task.cancel()
+
+
+class AnalysisScheduler:
+    """
+    Weighted fair scheduler in front of the agents.
+
+    Jobs of each priority class wait in their own FIFO queue. Whenever an LLM
+    slot frees up, the eligible class with the lowest virtual time is served
+    and its virtual time advances by ``1 / weight``, so under contention each
+    class receives slots in proportion to its weight. ``reserved_slots`` slots
+    are never given to bulk jobs, so an interactive job never waits behind a
+    full set of bulk jobs.
+
+    Bulk jobs pass admission control: while the predicted queue time of an
+    interactive job exceeds ``interactive_slo_seconds``, new bulk jobs are
+    rejected with LoadShedError (policy "reject") or held back until the
+    interactive backlog drains (policy "defer"). Bulk jobs with a deadline
+    are rejected as soon as their predicted completion falls past it. Jobs
+    submitted together with ``submit_group`` (e.g. all agent calls for one
+    contract) pass admission control once, so a group never runs partially.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        weights: Optional[Dict[Priority, float]] = None,
+        reserved_slots: int = 1,
+        interactive_slo_seconds: float = 10.0,
+        shed_policy: Literal["reject", "defer"] = "defer",
+        initial_service_seconds: float = 5.0,
+        smoothing: float = 0.2,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrency: Maximum number of concurrent LLM-bound jobs
+            weights: Fair-share weight per priority class
+            reserved_slots: Slots only interactive jobs may use
+            interactive_slo_seconds: Target queue time for interactive jobs
+            shed_policy: What to do with bulk work while the SLO is at risk
+            initial_service_seconds: Job duration estimate before any job completes
+            smoothing: Weight of the latest duration in the moving average
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if not 0 <= reserved_slots < max_concurrency:
+            raise ValueError("reserved_slots must leave at least one slot for bulk jobs")
+        self.max_concurrency = max_concurrency
+        self.weights = weights or {Priority.INTERACTIVE: 4.0, Priority.BULK: 1.0}
+        self.reserved_slots = reserved_slots
+        self.interactive_slo_seconds = interactive_slo_seconds
+        self.shed_policy = shed_policy
+        self.estimated_service_seconds = initial_service_seconds
+        self.smoothing = smoothing
+
+        self._queues: Dict[Priority, Deque[_Job]] = {priority: deque() for priority in Priority}
+        self._deferred: Deque[List[_Job]] = deque()
+        self._running: Dict[Priority, int] = {priority: 0 for priority in Priority}
+        self._virtual_time: Dict[Priority, float] = {priority: 0.0 for priority in Priority}
+        self._clock = 0.0
+        # Strong references to running tasks; the event loop only keeps weak ones
+        self._tasks: Set[asyncio.Task] = set()
+        self._metrics: Dict[Priority, ClassMetrics] = {
+            priority: ClassMetrics() for priority in Priority
+        }
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "AnalysisScheduler":
+        """Create a scheduler from application settings."""
+        return cls(
+            max_concurrency=settings.llm_max_concurrency,
+            reserved_slots=settings.interactive_reserved_slots,
+            interactive_slo_seconds=settings.interactive_slo_seconds,
+            shed_policy=settings.bulk_shed_policy,
+        )
+
+    @property
+    def running(self) -> int:
+        """Number of jobs currently holding a slot."""
+        return sum(self._running.values())
+
+    def predicted_wait(self, priority: Priority, extra: int = 0) -> float:
+        """
+        Predict how long a job submitted now would wait for a slot.
+
+        Interactive jobs only queue behind other interactive jobs; bulk jobs
+        queue behind everything and only use the non-reserved slots.
+
+        Args:
+            priority: Traffic class of the job
+            extra: Jobs submitted together with it that are queued ahead of it
+        """
+        if priority is Priority.INTERACTIVE:
+            ahead = len(self._queues[Priority.INTERACTIVE]) + extra
+            slots = self.max_concurrency
+            busy = self.running >= slots
+        else:
+            queued = len(self._queues[Priority.INTERACTIVE]) + len(self._queues[Priority.BULK])
+            ahead = queued + extra
+            slots = self.max_concurrency - self.reserved_slots
+            busy = self._running[Priority.BULK] >= slots or self.running >= self.max_concurrency
+        if not busy and ahead == 0:
+            return 0.0
+        return self.estimated_service_seconds * (ahead + 1) / slots
+
+    def _slo_at_risk(self) -> bool:
+        return self.predicted_wait(Priority.INTERACTIVE) > self.interactive_slo_seconds
+
+    def _misses_deadline(self, jobs: List[_Job]) -> bool:
+        """Whether the last job of a group is predicted to finish past the deadline."""
+        deadline = jobs[0].deadline
+        if deadline is None:
+            return False
+        wait = self.predicted_wait(jobs[0].priority, extra=len(jobs) - 1)
+        return time.monotonic() + wait + self.estimated_service_seconds > deadline
+
+    def _shed(self, jobs: List[_Job], reason: str) -> None:
+        priority = jobs[0].priority
+        self._metrics[priority].shed += len(jobs)
+        logger.warning(f"Shedding {len(jobs)} {priority.value} job(s): {reason}")
+        for job in jobs:
+            if not job.future.done():
+                job.future.set_exception(LoadShedError(reason))
+
+    async def submit(
+        self,
+        fn: Callable[[], Awaitable[Any]],
+        priority: Union[Priority, str] = Priority.INTERACTIVE,
+        deadline_seconds: Optional[float] = None,
+    ) -> Any:
+        """
+        Run a coroutine function once the scheduler grants it a slot.
+
+        Args:
+            fn: Zero-argument coroutine function, e.g. ``lambda: agent.analyze(x)``
+            priority: Traffic class of the job
+            deadline_seconds: Time from now by which the job should complete
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            LoadShedError: If admission control rejects the job
+        """
+        results = await self.submit_group([fn], priority, deadline_seconds)
+        return results[0]
+
+    async def submit_group(
+        self,
+        fns: Sequence[Callable[[], Awaitable[Any]]],
+        priority: Union[Priority, str] = Priority.INTERACTIVE,
+        deadline_seconds: Optional[float] = None,
+    ) -> List[Any]:
+        """
+        Run several coroutine functions that are admitted or shed as a whole.
+
+        Use this for work whose results are only useful together, such as the
+        agent calls for one contract: either every job gets a slot or none of
+        them is started.
+
+        Args:
+            fns: Zero-argument coroutine functions
+            priority: Traffic class of the jobs
+            deadline_seconds: Time from now by which all jobs should complete
+
+        Returns:
+            The coroutines' results, in order
+
+        Raises:
+            LoadShedError: If admission control rejects the group
+        """
+        priority = Priority(priority)
+        deadline = None if deadline_seconds is None else time.monotonic() + deadline_seconds
+        loop = asyncio.get_running_loop()
+        jobs = [_Job(fn, priority, loop.create_future(), deadline) for fn in fns]
+        if not jobs:
+            return []
+
+        admitted = True
+        if priority is Priority.BULK:
+            if self._misses_deadline(jobs):
+                admitted = False
+                self._shed(jobs, "predicted completion exceeds deadline")
+            elif self._slo_at_risk() or self._deferred:
+                admitted = False
+                if self.shed_policy == "reject":
+                    self._shed(jobs, "interactive SLO at risk")
+                else:
+                    self._metrics[priority].deferred_total += len(jobs)
+                    self._deferred.append(jobs)
+
+        if admitted:
+            for job in jobs:
+                self._enqueue(job)
+        self._dispatch()
+        return list(await asyncio.gather(*(job.future for job in jobs)))
+
+    def _enqueue(self, job: _Job) -> None:
+        queue = self._queues[job.priority]
+        if not queue:
+            # A class returning from idle must not bank credit from its idle time
+            self._virtual_time[job.priority] = max(self._virtual_time[job.priority], self._clock)
+        queue.append(job)
+        self._metrics[job.priority].admitted += 1
+
+    def _release_deferred(self) -> None:
+        while self._deferred and not self._slo_at_risk():
+            pending = [job for job in self._deferred.popleft() if not job.future.done()]
+            if not pending:
+                continue
+            if self._misses_deadline(pending):
+                self._shed(pending, "predicted completion exceeds deadline")
+            else:
+                for job in pending:
+                    self._enqueue(job)
+
+    def _eligible(self, priority: Priority) -> bool:
+        if not self._queues[priority]:
+            return False
+        if priority is Priority.BULK:
+            return self._running[Priority.BULK] < self.max_concurrency - self.reserved_slots
+        return True
+
+    def _dispatch(self) -> None:
+        self._release_deferred()
+        while self.running < self.max_concurrency:
+            candidates = [priority for priority in Priority if self._eligible(priority)]
+            if not candidates:
+                return
+            priority = min(
+                candidates,
+                key=lambda candidate: (self._virtual_time[candidate], -self.weights[candidate]),
+            )
+            job = self._queues[priority].popleft()
+            if job.future.done():
+                # Caller gave up (cancelled) while the job was queued
+                continue
+            self._clock = self._virtual_time[priority]
+            self._virtual_time[priority] += 1.0 / self.weights[priority]
+            self._running[priority] += 1
+            task = asyncio.ensure_future(self._run(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            # Free the slot as soon as the caller stops waiting for the result
+            job.future.add_done_callback(partial(_propagate_cancel, task))
+
+    async def _run(self, job: _Job) -> None:
+        started = time.monotonic()
+        cancelled = False
+        try:
+            result = await job.fn()
+        except asyncio.CancelledError:
+            cancelled = True
+            job.future.cancel()
+            raise
+        except Exception as error:
+            if not job.future.done():
+                job.future.set_exception(error)
+        else:
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            self._running[job.priority] -= 1
+            if cancelled:
+                # Partial durations would skew the service time estimate
+                self._metrics[job.priority].cancelled += 1
+            else:
+                elapsed = time.monotonic() - started
+                self.estimated_service_seconds += self.smoothing * (
+                    elapsed - self.estimated_service_seconds
+                )
+                self._metrics[job.priority].completed += 1
+            self._dispatch()
+
+    def metrics(self) -> SchedulerMetrics:
+        """Return queue depth, running, admitted, completed, deferred and shed counts."""
+        classes = {}
+        for priority in Priority:
+            counters = self._metrics[priority].model_copy()
+            counters.queue_depth = sum(not job.future.done() for job in self._queues[priority])
+            counters.deferred = sum(
+                not job.future.done()
+                for group in self._deferred
+                for job in group
+                if job.priority is priority
+            )
+            counters.running = self._running[priority]
+            classes[priority] = counters
+        return SchedulerMetrics(
+            max_concurrency=self.max_concurrency,
+            estimated_service_seconds=self.estimated_service_seconds,
+            predicted_interactive_wait=self.predicted_wait(Priority.INTERACTIVE),
+            classes=classes,
+        )
@@ -0,0 +1,139 @@
+"""Startup benchmark based on ``python -X importtime``."""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from pydantic import BaseModel, Field
+
+# Cumulative import time budget for the application entry point
+STARTUP_BUDGET_MS = 150.0
+
+# Third-party SDKs that must only be imported when an agent or service needs them
+HEAVY_MODULES = [
+    "pydantic",
+    "pydantic_settings",
+    "numpy",
+    "pandas",
+    "pyarrow",
+    "langchain",
+    "langgraph",
+    "langfuse",
+    "openai",
+    "anthropic",
+    "boto3",
+    "supabase",
+    "tiktoken",
+]
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+class ImportTiming(BaseModel):
+    """Import time of a single module as reported by ``-X importtime``."""
+
+    module: str = Field(description="Fully qualified module name")
+    self_us: int = Field(description="Time spent in the module itself (microseconds)")
+    cumulative_us: int = Field(description="Time including nested imports (microseconds)")
+    depth: int = Field(description="Nesting level in the import tree")
+
+
+class StartupProfile(BaseModel):
+    """Import profile of one module in a fresh interpreter."""
+
+    module: str = Field(description="Profiled module")
+    timings: List[ImportTiming] = Field(description="One entry per imported module")
+
+    @property
+    def total_ms(self) -> float:
+        """Cumulative import time of the profiled module in milliseconds."""
+        for timing in reversed(self.timings):
+            if timing.module == self.module:
+                return timing.cumulative_us / 1000
+        return 0.0
+
+    def imported(self, prefixes: Sequence[str]) -> List[str]:
+        """Return the modules or packages from ``prefixes`` that were imported."""
+        loaded = [timing.module for timing in self.timings]
+        return [
+            prefix for prefix in prefixes
+            if any(module == prefix or module.startswith(prefix + ".") for module in loaded)
+        ]
+
+    def slowest(self, limit: int = 15) -> List[ImportTiming]:
+        """Modules with the highest self time."""
+        return sorted(self.timings, key=lambda timing: timing.self_us, reverse=True)[:limit]
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Parse the stderr of ``python -X importtime``."""
+    timings = []
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(ImportTiming(
+                module=module,
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(indent) - 1) // 2,
+            ))
+    return timings
+
+
+def profile_imports(
+    module: str = "src.main",
+    python: str = sys.executable,
+    env: Optional[Dict[str, str]] = None,
+) -> StartupProfile:
+    """
+    Import a module in a fresh interpreter and record import times.
+
+    Args:
+        module: Module to import
+        python: Interpreter to run
+        env: Environment for the subprocess
+
+    Returns:
+        Parsed import profile
+    """
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        env=env,
+        check=True,
+    )
+    return StartupProfile(module=module, timings=parse_importtime(completed.stderr))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Print the slowest imports and check the startup budget."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("module", nargs="?", default="src.main")
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs; the fastest one is reported")
+    args = parser.parse_args(argv)
+
+    profile = min(
+        (profile_imports(args.module) for _ in range(args.repeat)),
+        key=lambda candidate: candidate.total_ms,
+    )
+    for timing in profile.slowest():
+        self_ms, cumulative_ms = timing.self_us / 1000, timing.cumulative_us / 1000
+        print(f"{self_ms:8.2f} ms  {cumulative_ms:8.2f} ms  {timing.module}")
+
+    heavy = profile.imported(HEAVY_MODULES)
+    print(f"\n{args.module}: {profile.total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    if heavy:
+        print(f"Heavy modules imported at startup: {', '.join(heavy)}")
+    return 0 if profile.total_ms <= args.budget_ms and not heavy else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
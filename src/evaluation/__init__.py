@@ -0,0 +1,11 @@
+"""Evaluation of agent outputs against annotated contract datasets."""
+
+from .cuad import SpanTable, evaluate, load_cuad, match_spans, summarize
+
+__all__ = [
+    "SpanTable",
+    "evaluate",
+    "load_cuad",
+    "match_spans",
+    "summarize",
+]
@@ -0,0 +1,306 @@
+"""Vectorized span-level evaluation against CUAD annotations."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+SpanRecord = Tuple[str, str, int, int]  # (document, category, start, end)
+
+METRIC_COLUMNS = [
+    "system", "category", "num_gold", "num_pred", "tp_pred", "tp_gold",
+    "precision", "recall", "f1_score", "doc_accuracy",
+]
+
+
+class SpanTable:
+    """
+    Character spans stored as parallel NumPy arrays.
+
+    Documents and categories are dictionary-encoded as int32 codes; rows are
+    sorted by (category, document, start) so the spans of one category form a
+    contiguous slice.
+    """
+
+    __slots__ = ("documents", "categories", "doc", "category", "start", "end", "_offsets")
+
+    def __init__(
+        self,
+        documents: Sequence[str],
+        categories: Sequence[str],
+        doc: np.ndarray,
+        category: np.ndarray,
+        start: np.ndarray,
+        end: np.ndarray,
+    ):
+        """
+        Initialize the table.
+
+        Args:
+            documents: Document vocabulary (code -> document id)
+            categories: Category vocabulary (code -> category name)
+            doc: Document code per span
+            category: Category code per span
+            start: Start character offset per span
+            end: End character offset per span (exclusive)
+        """
+        order = np.lexsort((start, doc, category))
+        self.documents = list(documents)
+        self.categories = list(categories)
+        self.doc = np.asarray(doc, dtype=np.int32)[order]
+        self.category = np.asarray(category, dtype=np.int32)[order]
+        self.start = np.asarray(start, dtype=np.int64)[order]
+        self.end = np.asarray(end, dtype=np.int64)[order]
+        self._offsets = np.searchsorted(self.category, np.arange(len(self.categories) + 1))
+
+    def __len__(self) -> int:
+        return len(self.doc)
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[SpanRecord],
+        documents: Optional[Sequence[str]] = None,
+        categories: Optional[Sequence[str]] = None,
+    ) -> "SpanTable":
+        """
+        Build a table from (document, category, start, end) records.
+
+        Args:
+            records: Span records
+            documents: Fixed document vocabulary; records outside it are dropped
+            categories: Fixed category vocabulary; records outside it are dropped
+
+        Returns:
+            Span table using the given (or discovered) vocabularies
+        """
+        records = list(records)
+        if documents is None:
+            documents = sorted({record[0] for record in records})
+        if categories is None:
+            categories = sorted({record[1] for record in records})
+        doc_codes = {name: code for code, name in enumerate(documents)}
+        category_codes = {name: code for code, name in enumerate(categories)}
+
+        kept = [
+            (doc_codes[document], category_codes[category], start, end)
+            for document, category, start, end in records
+            if document in doc_codes and category in category_codes
+        ]
+        columns = np.array(kept, dtype=np.int64).reshape(-1, 4)
+        doc, category, start, end = columns.T
+        return cls(documents, categories, doc, category, start, end)
+
+    def category_slice(self, code: int) -> slice:
+        """Row range holding the spans of one category."""
+        return slice(int(self._offsets[code]), int(self._offsets[code + 1]))
+
+
+def _read_cuad(path: Path) -> SpanTable:
+    with open(path, encoding="utf-8") as handle:
+        dataset = json.load(handle)
+
+    documents = []
+    records: List[SpanRecord] = []
+    for contract in dataset["data"]:
+        documents.append(contract["title"])
+        for paragraph in contract["paragraphs"]:
+            for qa in paragraph["qas"]:
+                category = qa["id"].rsplit("__", 1)[-1]
+                for answer in qa.get("answers", []):
+                    start = answer["answer_start"]
+                    end = start + len(answer["text"])
+                    records.append((contract["title"], category, start, end))
+    categories = sorted({
+        qa["id"].rsplit("__", 1)[-1]
+        for contract in dataset["data"]
+        for paragraph in contract["paragraphs"]
+        for qa in paragraph["qas"]
+    })
+    return SpanTable.from_records(records, documents=documents, categories=categories)
+
+
+@lru_cache(maxsize=4)
+def _load_cached(path: str, mtime_ns: int) -> SpanTable:
+    return _read_cuad(Path(path))
+
+
+def load_cuad(path: Union[str, Path] = "data/cuad/CUADv1.json") -> SpanTable:
+    """
+    Load CUAD gold annotations (SQuAD-style JSON) into a span table.
+
+    The parsed table is cached per file and modification time, so repeated
+    evaluations in one process only parse the 13k annotations once.
+
+    Args:
+        path: Path to CUADv1.json (or a file in the same format)
+
+    Returns:
+        Gold span table with one category per CUAD question type
+    """
+    path = Path(path).resolve()
+    return _load_cached(str(path), path.stat().st_mtime_ns)
+
+
+def match_spans(
+    gold_doc: np.ndarray,
+    gold_start: np.ndarray,
+    gold_end: np.ndarray,
+    pred_doc: np.ndarray,
+    pred_start: np.ndarray,
+    pred_end: np.ndarray,
+    iou_threshold: float = 0.5,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Match predicted spans to gold spans by interval overlap.
+
+    A prediction and a gold span match if they are in the same document and
+    their intersection-over-union is at least ``iou_threshold``.
+
+    Returns:
+        Boolean arrays: which predictions matched any gold span, and which
+        gold spans were matched by any prediction
+    """
+    if len(gold_doc) == 0 or len(pred_doc) == 0:
+        return np.zeros(len(pred_doc), dtype=bool), np.zeros(len(gold_doc), dtype=bool)
+
+    intersection = np.clip(
+        np.minimum(pred_end[:, None], gold_end[None, :])
+        - np.maximum(pred_start[:, None], gold_start[None, :]),
+        0,
+        None,
+    )
+    union = (pred_end - pred_start)[:, None] + (gold_end - gold_start)[None, :] - intersection
+    iou = intersection / np.maximum(union, 1)
+    matched = (pred_doc[:, None] == gold_doc[None, :]) & (iou >= iou_threshold) & (intersection > 0)
+    return matched.any(axis=1), matched.any(axis=0)
+
+
+def _ratio(numerator: float, denominator: float) -> float:
+    return numerator / denominator if denominator else 0.0
+
+
+def _evaluate_category(
+    gold: SpanTable,
+    predictions: Dict[str, SpanTable],
+    code: int,
+    iou_threshold: float,
+) -> List[Dict[str, object]]:
+    rows = []
+    gold_rows = gold.category_slice(code)
+    gold_doc = gold.doc[gold_rows]
+    gold_present = np.zeros(len(gold.documents), dtype=bool)
+    gold_present[gold_doc] = True
+
+    for system, predicted in predictions.items():
+        pred_rows = predicted.category_slice(code)
+        pred_doc = predicted.doc[pred_rows]
+        pred_matched, gold_matched = match_spans(
+            gold_doc, gold.start[gold_rows], gold.end[gold_rows],
+            pred_doc, predicted.start[pred_rows], predicted.end[pred_rows],
+            iou_threshold,
+        )
+        pred_present = np.zeros(len(gold.documents), dtype=bool)
+        pred_present[pred_doc] = True
+
+        tp_pred, tp_gold = int(pred_matched.sum()), int(gold_matched.sum())
+        doc_accuracy = float(np.mean(pred_present == gold_present)) if len(gold.documents) else 0.0
+        precision = _ratio(tp_pred, len(pred_doc))
+        recall = _ratio(tp_gold, len(gold_doc))
+        rows.append({
+            "system": system,
+            "category": gold.categories[code],
+            "num_gold": len(gold_doc),
+            "num_pred": len(pred_doc),
+            "tp_pred": tp_pred,
+            "tp_gold": tp_gold,
+            "precision": precision,
+            "recall": recall,
+            "f1_score": _ratio(2 * precision * recall, precision + recall),
+            "doc_accuracy": doc_accuracy,
+        })
+    return rows
+
+
+def evaluate(
+    gold: SpanTable,
+    predictions: Dict[str, Union[SpanTable, Iterable[SpanRecord]]],
+    iou_threshold: float = 0.5,
+    max_workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Score several systems against the gold spans in one pass.
+
+    Categories are evaluated in parallel; within a category all systems are
+    scored against the same gold slice.
+
+    Args:
+        gold: Gold span table (see load_cuad)
+        predictions: Predicted spans per system name (tables or records)
+        iou_threshold: Minimum span IoU for a match
+        max_workers: Threads used across categories (defaults to the executor's)
+
+    Returns:
+        One row per (system, category) with precision, recall, f1_score and
+        document-level clause presence accuracy
+    """
+    tables = {
+        system: (
+            spans
+            if isinstance(spans, SpanTable)
+            and spans.documents == gold.documents
+            and spans.categories == gold.categories
+            else SpanTable.from_records(
+                _iter_records(spans), documents=gold.documents, categories=gold.categories
+            )
+        )
+        for system, spans in predictions.items()
+    }
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        per_category = executor.map(
+            lambda code: _evaluate_category(gold, tables, code, iou_threshold),
+            range(len(gold.categories)),
+        )
+        rows = [row for category_rows in per_category for row in category_rows]
+
+    return pd.DataFrame(rows, columns=METRIC_COLUMNS)
+
+
+def _iter_records(spans: Union[SpanTable, Iterable[SpanRecord]]) -> Iterable[SpanRecord]:
+    if not isinstance(spans, SpanTable):
+        return spans
+    return (
+        (spans.documents[doc], spans.categories[category], int(start), int(end))
+        for doc, category, start, end in zip(spans.doc, spans.category, spans.start, spans.end)
+    )
+
+
+def summarize(metrics: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate per-category metrics into micro and macro averages per system.
+
+    Args:
+        metrics: Output of evaluate()
+
+    Returns:
+        One row per system
+    """
+    grouped = metrics.groupby("system", sort=False)
+    totals = grouped[["num_gold", "num_pred", "tp_pred", "tp_gold"]].sum()
+    precision = totals["tp_pred"] / totals["num_pred"].where(totals["num_pred"] > 0)
+    recall = totals["tp_gold"] / totals["num_gold"].where(totals["num_gold"] > 0)
+    summary = pd.DataFrame({
+        "micro_precision": precision.fillna(0.0),
+        "micro_recall": recall.fillna(0.0),
+        "micro_f1": (2 * precision * recall / (precision + recall)).fillna(0.0),
+        "macro_precision": grouped["precision"].mean(),
+        "macro_recall": grouped["recall"].mean(),
+        "macro_f1": grouped["f1_score"].mean(),
+        "doc_accuracy": grouped["doc_accuracy"].mean(),
+    })
+    return summary.reset_index()
@@ -2,38 +2,90 @@
 
 import asyncio
 import logging
+from functools import partial
+from importlib import import_module
 from pathlib import Path
-from typing import Dict, Any
-
-from src.core.config import settings
-from src.agents import (
-    RiskAnalysisAgent,
-    ClauseAlignmentAgent,
-    ObligationTrackingAgent,
-    DependencyGraphAgent,
-)
-from src.agents.base import AgentInput
-
-
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+from typing import TYPE_CHECKING, Dict, Any, Optional, Union, cast
+
+if TYPE_CHECKING:
+    from src.agents.base import BaseAgent
+    from src.core.document import ContractSpan
+    from src.core.scheduler import AnalysisScheduler, Priority
+
 logger = logging.getLogger(__name__)
 
+# (result key, settings flag, module, class) for each agent. Agent modules are
+# imported only when the agent is enabled and first used, so SDKs an agent
+# depends on are not loaded at startup.
+AGENT_REGISTRY = [
+    ("risk_analysis", "enable_risk_agent", "src.agents.risk_agent", "RiskAnalysisAgent"),
+    ("clause_alignment", "enable_clause_agent", "src.agents.clause_agent", "ClauseAlignmentAgent"),
+    (
+        "obligation_tracking",
+        "enable_obligation_agent",
+        "src.agents.obligation_agent",
+        "ObligationTrackingAgent",
+    ),
+    (
+        "dependency_graph",
+        "enable_dependency_agent",
+        "src.agents.dependency_agent",
+        "DependencyGraphAgent",
+    ),
+]
+
+_logging_configured = False
+
+
+def configure_logging() -> None:
+    """Configure root logging from settings (only once per process)."""
+    from src.core.config import get_settings
+
+    global _logging_configured
+    if _logging_configured:
+        return
+    logging.basicConfig(
+        level=getattr(logging, get_settings().log_level),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    _logging_configured = True
+
 
-async def analyze_contract(contract_text: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+def load_agent(module_name: str, class_name: str) -> "BaseAgent":
+    """Import an agent module on demand and instantiate the agent with its defaults."""
+    return cast("BaseAgent", getattr(import_module(module_name), class_name)())
+
+
+async def analyze_contract(
+    contract_text: Union[str, "ContractSpan"],
+    metadata: Dict[str, Any] = None,
+    scheduler: Optional["AnalysisScheduler"] = None,
+    priority: Union["Priority", str] = "interactive",
+    deadline_seconds: Optional[float] = None,
+) -> Dict[str, Any]:
     """
     Analyze a contract using all enabled agents.
 
     Args:
-        contract_text: The contract text to analyze
+        contract_text: The contract text to analyze, or a span over a ContractDocument
         metadata: Optional metadata about the contract
+        scheduler: Optional scheduler that admits and prioritizes the agent calls
+        priority: Traffic class ("interactive" or "bulk") when a scheduler is used
+        deadline_seconds: Optional completion deadline for bulk work
 
     Returns:
         Combined analysis results from all agents
+
+    Raises:
+        LoadShedError: If the scheduler sheds the contract (all agent calls are
+            admitted or shed together)
     """
+    from src.agents.base import AgentInput
+    from src.core.config import get_settings
+
+    configure_logging()
+    settings = get_settings()
+
     if metadata is None:
         metadata = {}
 
@@ -47,26 +99,22 @@ async def analyze_contract(contract_text: str, metadata: Dict[str, Any] = None)
     # Initialize and run agents
     agents = []
 
-    if settings.enable_risk_agent:
-        logger.info("Initializing Risk Analysis Agent")
-        agents.append(("risk_analysis", RiskAnalysisAgent()))
-
-    if settings.enable_clause_agent:
-        logger.info("Initializing Clause Alignment Agent")
-        agents.append(("clause_alignment", ClauseAlignmentAgent()))
-
-    if settings.enable_obligation_agent:
-        logger.info("Initializing Obligation Tracking Agent")
-        agents.append(("obligation_tracking", ObligationTrackingAgent()))
-
-    if settings.enable_dependency_agent:
-        logger.info("Initializing Dependency Graph Agent")
-        agents.append(("dependency_graph", DependencyGraphAgent()))
+    for result_key, flag, module_name, class_name in AGENT_REGISTRY:
+        if getattr(settings, flag):
+            logger.info(f"Initializing {class_name}")
+            agents.append((result_key, load_agent(module_name, class_name)))
 
     # Run agents concurrently
     logger.info(f"Running {len(agents)} agents concurrently")
-    agent_tasks = [agent.analyze(agent_input) for _, agent in agents]
-    agent_results = await asyncio.gather(*agent_tasks)
+    if scheduler is None:
+        agent_results = await asyncio.gather(*(agent.analyze(agent_input) for _, agent in agents))
+    else:
+        # Admit the contract once so no agent call runs for a contract that is shed
+        agent_results = await scheduler.submit_group(
+            [partial(agent.analyze, agent_input) for _, agent in agents],
+            priority=priority,
+            deadline_seconds=deadline_seconds,
+        )
 
     # Combine results
     for (agent_name, _), result in zip(agents, agent_results):
@@ -78,6 +126,11 @@ async def analyze_contract(contract_text: str, metadata: Dict[str, Any] = None)
 
 async def main():
     """Main function for testing the system."""
+    from src.core.config import get_settings
+
+    configure_logging()
+    settings = get_settings()
+
     logger.info("Multi-Agent CLM System Starting")
     logger.info(f"LLM Provider: {settings.llm_provider}")
     logger.info(f"LLM Model: {settings.llm_model}")
@@ -0,0 +1,210 @@
+"""Unit tests for the near-duplicate clause index."""
+
+import pytest
+from src.agents import ClauseAlignmentAgent, ObligationTrackingAgent, RiskAnalysisAgent
+from src.agents.base import AgentInput
+from src.core.clause_index import ClauseIndex, normalize_clause
+from src.core.document import ContractDocument
+
+
+PAYMENT_A = (
+    "Company A shall pay Company B $10,000 per month, due on January 1, 2024. "
+    "Late payments will incur a penalty of 5% per week until paid in full."
+)
+PAYMENT_B = (
+    "Acme Corp shall pay Globex Ltd $25,000 per month, due on March 15, 2025. "
+    "Late payments will incur a penalty of 5% per week until paid in full."
+)
+# Same template as PAYMENT_B with a different penalty rate
+PAYMENT_C = PAYMENT_B.replace("5%", "2%")
+CONFIDENTIALITY = (
+    "Both parties agree to maintain confidentiality of all proprietary information "
+    "disclosed during the term of this Agreement and for 5 years thereafter."
+)
+
+
+class TestNormalizeClause:
+    """Tests for clause normalization."""
+
+    def test_templated_clauses_normalize_identically(self):
+        """Test parties, amounts, dates and numbers are replaced."""
+        first = normalize_clause(PAYMENT_A, parties=["Company A", "Company B"])
+        second = normalize_clause(PAYMENT_B, parties=["Acme Corp", "Globex Ltd"])
+
+        assert first.text == second.text
+        assert first.entities["party"] == ["Company A", "Company B"]
+        assert first.entities["amount"] == ["$10,000"]
+        assert first.entities["date"] == ["January 1, 2024"]
+
+
+class TestClauseIndex:
+    """Tests for ClauseIndex."""
+
+    def test_query_finds_near_duplicate_with_substitution(self):
+        """Test reused findings are rewritten to the new entities."""
+        index = ClauseIndex(threshold=0.8)
+        index.add(
+            "C-001:2",
+            PAYMENT_A,
+            {"red_flags": ["Company B charges 5% per week on $10,000"]},
+            parties=["Company A", "Company B"],
+        )
+        index.add("C-001:5", CONFIDENTIALITY, {"red_flags": []})
+
+        matches = index.query(PAYMENT_B, parties=["Acme Corp", "Globex Ltd"])
+
+        assert [match.key for match in matches] == ["C-001:2"]
+        assert matches[0].similarity == 1.0
+        assert matches[0].findings == {"red_flags": ["Globex Ltd charges 5% per week on $25,000"]}
+
+    def test_clauses_differing_in_a_number_are_not_reused(self):
+        """Test notice periods and rates are part of the clause, not placeholders."""
+        index = ClauseIndex(threshold=0.5)
+        termination = (
+            "Either party may terminate this Agreement for convenience at any time "
+            "with {} days written notice to the other party."
+        )
+        index.add("C-001:9", termination.format(30), {"red_flags": ["30 days notice is short"]})
+        longer = termination.format(365)
+
+        assert index.query(longer)[0].similarity < 1.0
+        assert index.query(longer, match_numbers=True) == []
+        assert index.query(PAYMENT_C, match_numbers=True) == []
+
+    def test_substitution_respects_token_boundaries(self):
+        """Test numbers that are not entities are left untouched in findings."""
+        index = ClauseIndex(threshold=0.8)
+        index.add(
+            "C-001:7",
+            "Invoices are due within 30 days of January 1, 2024 and renew every 1 year.",
+            {"red_flags": ["late fee of 10% applies; see section 11 of the January 1, 2024 terms"]},
+        )
+
+        matches = index.query(
+            "Invoices are due within 30 days of March 3, 2025 and renew every 1 year."
+        )
+
+        assert matches[0].findings == {
+            "red_flags": ["late fee of 10% applies; see section 11 of the March 3, 2025 terms"]
+        }
+        assert "30" not in matches[0].substitutions
+
+    def test_same_key_in_several_namespaces(self):
+        """Test agents indexing the same clause key do not overwrite each other."""
+        index = ClauseIndex(threshold=0.8)
+        index.add("C-001:5", CONFIDENTIALITY, {"agent": "risk"}, namespace="RiskAnalysisAgent")
+        index.add("C-001:5", CONFIDENTIALITY, {"agent": "obl"}, namespace="ObligationTrackingAgent")
+
+        assert len(index) == 2
+        risk = index.query(CONFIDENTIALITY, namespace="RiskAnalysisAgent")
+        assert [match.findings for match in risk] == [{"agent": "risk"}]
+        assert index.candidate_pairs() == []
+
+    def test_query_respects_threshold_and_namespace(self):
+        """Test dissimilar clauses and other namespaces are not returned."""
+        index = ClauseIndex(threshold=0.8)
+        index.add("C-001:5", CONFIDENTIALITY, {}, namespace="RiskAnalysisAgent")
+
+        assert index.query(PAYMENT_A) == []
+        assert index.query(CONFIDENTIALITY, namespace="ObligationTrackingAgent") == []
+        assert len(index.query(CONFIDENTIALITY, namespace="RiskAnalysisAgent")) == 1
+
+    def test_candidate_pairs(self):
+        """Test near-duplicate pairs inside the index are reported once."""
+        index = ClauseIndex(threshold=0.8)
+        index.add("C-001:2", PAYMENT_A, {}, parties=["Company A", "Company B"])
+        index.add("C-002:2", PAYMENT_B, {}, parties=["Acme Corp", "Globex Ltd"])
+        index.add("C-001:5", CONFIDENTIALITY, {})
+
+        assert index.candidate_pairs() == [("C-001:2", "C-002:2", 1.0)]
+
+    def test_invalid_bands(self):
+        """Test bands must divide the number of permutations."""
+        with pytest.raises(ValueError):
+            ClauseIndex(num_perm=128, bands=30)
+
+
+class TestAnalyzeWithReuse:
+    """Tests for reusing prior analyses in agents."""
+
+    @pytest.mark.asyncio
+    async def test_second_clause_reuses_first(self):
+        """Test provenance is recorded when findings are reused."""
+        index = ClauseIndex(threshold=0.8)
+        agent = RiskAnalysisAgent()
+
+        first = await agent.analyze_with_reuse(
+            AgentInput(contract_text=PAYMENT_A, metadata={"parties": ["Company A", "Company B"]}),
+            index,
+            key="C-001:2",
+        )
+        second = await agent.analyze_with_reuse(
+            AgentInput(contract_text=PAYMENT_B, metadata={"parties": ["Acme Corp", "Globex Ltd"]}),
+            index,
+        )
+
+        assert "reused_from" not in first.metadata
+        assert second.metadata["reused_from"]["key"] == "C-001:2"
+        assert second.metadata["reused_from"]["substitutions"]["$10,000"] == "$25,000"
+        assert len(index) == 1
+
+    @pytest.mark.asyncio
+    async def test_agents_share_clause_keys(self):
+        """Test several agents can index and reuse the same clause key."""
+        index = ClauseIndex(threshold=0.8)
+        risk, obligation = RiskAnalysisAgent(), ObligationTrackingAgent()
+        first = AgentInput(
+            contract_text=PAYMENT_A, metadata={"parties": ["Company A", "Company B"]}
+        )
+        second = AgentInput(
+            contract_text=PAYMENT_B, metadata={"parties": ["Acme Corp", "Globex Ltd"]}
+        )
+
+        await risk.analyze_with_reuse(first, index, key="C-001:2")
+        await obligation.analyze_with_reuse(first, index, key="C-001:2")
+        reused = await risk.analyze_with_reuse(second, index)
+
+        assert len(index) == 2
+        assert reused.agent_name == "RiskAnalysisAgent"
+        assert reused.metadata["reused_from"]["key"] == "C-001:2"
+
+    @pytest.mark.asyncio
+    async def test_different_rate_is_analyzed_afresh(self):
+        """Test findings are not reused for a clause with a different number."""
+        index = ClauseIndex(threshold=0.5)
+        agent = RiskAnalysisAgent()
+        parties = {"parties": ["Acme Corp", "Globex Ltd"]}
+
+        await agent.analyze_with_reuse(
+            AgentInput(contract_text=PAYMENT_B, metadata=parties), index, key="C-002:2"
+        )
+        output = await agent.analyze_with_reuse(
+            AgentInput(contract_text=PAYMENT_C, metadata=parties), index
+        )
+
+        assert "reused_from" not in output.metadata
+
+    @pytest.mark.asyncio
+    async def test_clause_agent_standardization_candidates(self):
+        """Test ClauseAlignmentAgent lists near-duplicates from the index."""
+        index = ClauseIndex(threshold=0.7)
+        for namespace in ("RiskAnalysisAgent", "ObligationTrackingAgent"):
+            index.add(
+                "LIB:payment", PAYMENT_A, {}, parties=["Company A", "Company B"],
+                namespace=namespace,
+            )
+        services = "1. SERVICES\nProvider shall provide services.\n"
+        index.add("LIB:services", services, {})
+        agent = ClauseAlignmentAgent(clause_index=index)
+
+        contract = f"PREAMBLE\n{services}\n2. PAYMENT\n{PAYMENT_C}\n"
+        document = ContractDocument.from_text(contract)
+        result = await agent.analyze(AgentInput(
+            contract_text=document.span(len("PREAMBLE\n")),
+            metadata={"parties": ["Acme Corp", "Globex Ltd"]},
+        ))
+
+        # Identical SERVICES clause is skipped; PAYMENT is listed once despite two namespaces
+        candidates = result.result["standardization_candidates"]
+        assert [candidate["clause"] for candidate in candidates] == ["2"]
+        assert [match["key"] for match in candidates[0]["matches"]] == ["LIB:payment"]
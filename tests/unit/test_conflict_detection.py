@@ -0,0 +1,107 @@
+"""Unit tests for portfolio conflict detection."""
+
+import pytest
+from src.agents.base import AgentInput, ContractRecord, MultiContractInput
+from src.core.conflict_detection import (
+    ConflictDetectionPipeline,
+    embedding_neighbour_pairs,
+    extract_clause_types,
+)
+from src.core.document import ContractDocument
+
+
+def contract(contract_id, counterparty, headings, embedding=None):
+    """Build a contract record with numbered headings."""
+    text = "\n".join(f"{i}. {heading}\nTerms.\n" for i, heading in enumerate(headings, 1))
+    return ContractRecord(
+        contract_id=contract_id,
+        contract_text=text,
+        counterparty=counterparty,
+        embedding=embedding,
+    )
+
+
+@pytest.fixture
+def portfolio():
+    """Portfolio with two suppliers and one unrelated lease."""
+    return MultiContractInput(contracts=[
+        contract("C-1", "Acme", ["PAYMENT TERMS", "LIABILITY"], [1.0, 0.0]),
+        contract("C-2", "ACME ", ["LIABILITY", "TERMINATION"], [0.0, 1.0]),
+        contract("C-3", "Globex", ["PAYMENT TERMS"], [0.99, 0.1]),
+        contract("C-4", "Initech", ["PREMISES"], [0.0, 1.0]),
+    ])
+
+
+class TestBlocking:
+    """Tests for candidate pair blocking."""
+
+    def test_extract_clause_types(self):
+        """Test clause types are derived from headings."""
+        record = contract("C-1", None, ["PAYMENT TERMS", "LIMITATION & LIABILITY"])
+        assert extract_clause_types(record) == {"payment_terms", "limitation_and_liability"}
+
+    def test_extract_clause_types_from_span(self):
+        """Test headings are read from the span's range of the shared document."""
+        document = ContractDocument.from_text(
+            "1. PAYMENT TERMS\nPay.\n2. LIABILITY\nCapped.\n3. TERMINATION\nNotice.\n"
+        )
+        clauses = document.clauses()
+        record = ContractRecord(
+            contract_id="C-1",
+            contract_text=document.span(clauses[1].start, clauses[2].start),
+        )
+        assert extract_clause_types(record) == {"liability"}
+
+    def test_embedding_neighbours(self):
+        """Test neighbours are limited to top-k above the similarity threshold."""
+        pairs = embedding_neighbour_pairs(
+            [[1.0, 0.0], [0.0, 1.0], [0.99, 0.1], None], top_k=1, min_similarity=0.5
+        )
+        assert pairs == {(0, 2)}
+
+    def test_block_reduces_pairs(self, portfolio):
+        """Test only pairs sharing a block and a clause type survive."""
+        pipeline = ConflictDetectionPipeline(top_k=1, min_similarity=0.9)
+        candidates, report = pipeline.block(portfolio)
+
+        assert candidates == [((0, 1), ["liability"]), ((0, 2), ["payment_terms"])]
+        assert report.total_pairs == 6
+        assert report.candidate_pairs == 2
+        assert report.reduction_ratio == pytest.approx(2 / 3)
+        assert "reduction_ratio" in report.model_dump()
+
+    def test_unclassified_contracts_are_wildcards(self):
+        """Test contracts without recognized headings are not pruned by clause type."""
+        portfolio = MultiContractInput(contracts=[
+            contract("C-1", "Acme", ["Payment Terms", "Limitation of Liability"]),
+            contract("C-2", "Acme", ["Payment Terms", "Limitation of Liability"]),
+            contract("C-3", "Acme", ["LIABILITY"]),
+        ])
+        candidates, report = ConflictDetectionPipeline().block(portfolio)
+
+        assert candidates == [((0, 1), []), ((0, 2), []), ((1, 2), [])]
+        assert report.unclassified_contracts == 2
+        assert report.reduction_ratio == 0.0
+
+
+class TestConflictDetectionPipeline:
+    """Tests for running the pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_run_analyzes_candidate_pairs(self, portfolio):
+        """Test each surviving pair is analyzed once."""
+        pipeline = ConflictDetectionPipeline(max_concurrency=2, top_k=1, min_similarity=0.9)
+        result = await pipeline.run(portfolio)
+
+        assert [pair.contract_ids for pair in result.pairs] == [("C-1", "C-2"), ("C-1", "C-3")]
+        assert result.pairs[0].output.agent_name == "ClauseAlignmentAgent"
+
+    def test_pair_prompt_includes_related_contract(self, portfolio):
+        """Test the related contract fills the clause agent's prompt."""
+        pipeline = ConflictDetectionPipeline()
+        first, second = portfolio.contracts[:2]
+        prompt = pipeline.agent.format_prompt(AgentInput(
+            contract_text=first.contract_text,
+            metadata={"related_contracts": second.contract_text},
+        ))
+        assert "TERMINATION" in prompt
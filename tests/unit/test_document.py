@@ -0,0 +1,102 @@
+"""Unit tests for span-based contract documents."""
+
+import json
+
+import pytest
+from src.agents import RiskAnalysisAgent
+from src.agents.base import AgentInput
+from src.core.document import ContractDocument, ContractSpan
+
+
+SAMPLE_CONTRACT = """SERVICES AGREEMENT
+Between Société Générale ("Client") and Provider.
+
+1. SERVICES
+Provider shall provide consulting services.
+
+2. PAYMENT TERMS
+Client shall pay €10,000 monthly.
+
+3. LIABILITY
+Provider's liability is limited to fees paid.
+"""
+
+
+@pytest.fixture
+def contract_file(tmp_path):
+    """Write the sample contract to a UTF-8 file."""
+    path = tmp_path / "contract.txt"
+    path.write_text(SAMPLE_CONTRACT, encoding="utf-8")
+    return path
+
+
+class TestContractDocument:
+    """Tests for ContractDocument."""
+
+    def test_from_file_is_memory_mapped(self, contract_file):
+        """Test file-backed documents decode to the original text."""
+        with ContractDocument.from_file(contract_file) as document:
+            assert document.span().text() == SAMPLE_CONTRACT
+            assert len(document) == len(SAMPLE_CONTRACT.encode("utf-8"))
+
+    def test_clauses_split_at_headings(self):
+        """Test clause spans follow numbered section headings."""
+        document = ContractDocument.from_text(SAMPLE_CONTRACT)
+        clauses = document.clauses()
+
+        assert [clause.label for clause in clauses] == ["preamble", "1", "2", "3"]
+        assert clauses[2].text().startswith("2. PAYMENT TERMS")
+        assert "".join(clause.text() for clause in clauses) == SAMPLE_CONTRACT
+
+    def test_chunks_respect_utf8_boundaries(self):
+        """Test chunks never split a multi-byte character."""
+        document = ContractDocument.from_text(SAMPLE_CONTRACT)
+        chunks = list(document.chunks(chunk_size=17, chunk_overlap=5))
+
+        assert chunks[0].start == 0
+        assert chunks[-1].end == len(document)
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current.start < previous.end
+        for chunk in chunks:
+            assert "�" not in chunk.text()
+
+    def test_invalid_overlap(self):
+        """Test overlap must be smaller than chunk size."""
+        document = ContractDocument.from_text(SAMPLE_CONTRACT)
+        with pytest.raises(ValueError):
+            list(document.chunks(chunk_size=10, chunk_overlap=10))
+
+
+class TestContractSpanInput:
+    """Tests for using spans as agent input."""
+
+    def test_span_has_no_instance_dict(self):
+        """Test spans stay lightweight."""
+        span = ContractDocument.from_text(SAMPLE_CONTRACT).span(0, 10)
+        assert not hasattr(span, "__dict__")
+
+    def test_span_materialized_in_prompt(self):
+        """Test prompts contain the span text, not its repr."""
+        document = ContractDocument.from_text(SAMPLE_CONTRACT)
+        liability = document.clauses()[-1]
+        agent_input = AgentInput(contract_text=liability)
+
+        assert isinstance(agent_input.contract_text, ContractSpan)
+        prompt = RiskAnalysisAgent().format_prompt(agent_input)
+        assert "Provider's liability is limited" in prompt
+        assert "PAYMENT TERMS" not in prompt
+
+    def test_span_input_serializes(self):
+        """Test span-backed inputs serialize to the span text."""
+        document = ContractDocument.from_text(SAMPLE_CONTRACT)
+        agent_input = AgentInput(contract_text=document.clauses()[-1])
+
+        dumped = json.loads(agent_input.model_dump_json())
+        assert dumped["contract_text"] == document.clauses()[-1].text()
+
+    @pytest.mark.asyncio
+    async def test_agent_accepts_span(self):
+        """Test agents analyze span-backed input."""
+        document = ContractDocument.from_text(SAMPLE_CONTRACT)
+        result = await RiskAnalysisAgent().analyze(AgentInput(contract_text=document.span()))
+        assert result.agent_name == "RiskAnalysisAgent"
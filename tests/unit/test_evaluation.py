@@ -0,0 +1,107 @@
+"""Unit tests for the CUAD evaluation engine."""
+
+import json
+
+import numpy as np
+import pytest
+from src.evaluation import SpanTable, evaluate, load_cuad, match_spans, summarize
+
+
+@pytest.fixture
+def cuad_file(tmp_path):
+    """Write a two-contract dataset in CUAD's SQuAD-style format."""
+    def qa(title, category, answers):
+        return {
+            "id": f"{title}__{category}",
+            "question": f"Highlight the parts related to {category}",
+            "answers": [{"text": "x" * length, "answer_start": start} for start, length in answers],
+            "is_impossible": not answers,
+        }
+
+    dataset = {"data": [
+        {"title": "DocA", "paragraphs": [{"context": "...", "qas": [
+            qa("DocA", "Governing Law", [(10, 20)]),
+            qa("DocA", "Cap On Liability", [(100, 50), (300, 40)]),
+        ]}]},
+        {"title": "DocB", "paragraphs": [{"context": "...", "qas": [
+            qa("DocB", "Governing Law", [(5, 15)]),
+            qa("DocB", "Cap On Liability", []),
+        ]}]},
+    ]}
+    path = tmp_path / "CUADv1.json"
+    path.write_text(json.dumps(dataset), encoding="utf-8")
+    return path
+
+
+class TestSpanTable:
+    """Tests for loading gold spans."""
+
+    def test_load_cuad(self, cuad_file):
+        """Test annotations become sorted array columns."""
+        gold = load_cuad(cuad_file)
+
+        assert gold.documents == ["DocA", "DocB"]
+        assert gold.categories == ["Cap On Liability", "Governing Law"]
+        assert len(gold) == 4
+        assert gold.start[gold.category_slice(0)].tolist() == [100, 300]
+
+    def test_load_cuad_is_cached(self, cuad_file):
+        """Test repeated loads reuse the parsed table."""
+        assert load_cuad(cuad_file) is load_cuad(cuad_file)
+
+    def test_from_records_drops_unknown_documents(self):
+        """Test predictions outside the gold vocabulary are ignored."""
+        table = SpanTable.from_records(
+            [("DocA", "Governing Law", 0, 5), ("DocZ", "Governing Law", 0, 5)],
+            documents=["DocA"],
+            categories=["Governing Law"],
+        )
+        assert len(table) == 1
+
+
+class TestMatching:
+    """Tests for interval overlap matching."""
+
+    def test_match_spans_iou(self):
+        """Test matches require same document and sufficient overlap."""
+        pred_matched, gold_matched = match_spans(
+            np.array([0, 0]), np.array([0, 100]), np.array([10, 110]),
+            np.array([0, 1, 0]), np.array([2, 0, 105]), np.array([10, 10, 200]),
+        )
+        assert pred_matched.tolist() == [True, False, False]
+        assert gold_matched.tolist() == [True, False]
+
+
+class TestEvaluate:
+    """Tests for multi-system evaluation."""
+
+    def test_metrics_for_several_systems(self, cuad_file):
+        """Test per-category metrics and summary for two systems."""
+        gold = load_cuad(cuad_file)
+        metrics = evaluate(gold, {
+            "multi_agent": [
+                ("DocA", "Governing Law", 10, 30),
+                ("DocB", "Governing Law", 5, 20),
+                ("DocA", "Cap On Liability", 100, 150),
+            ],
+            "rule_based_system": [
+                ("DocA", "Governing Law", 0, 100),
+                ("DocB", "Cap On Liability", 0, 10),
+            ],
+        }, max_workers=2)
+
+        assert len(metrics) == 4
+        row = metrics.set_index(["system", "category"]).loc[("multi_agent", "Cap On Liability")]
+        assert row["precision"] == 1.0
+        assert row["recall"] == 0.5
+        assert row["f1_score"] == pytest.approx(2 / 3)
+
+        indexed = metrics.set_index(["system", "category"])
+        baseline = indexed.loc[("rule_based_system", "Governing Law")]
+        assert baseline["precision"] == 0.0
+        assert baseline["doc_accuracy"] == 0.5
+
+        summary = summarize(metrics).set_index("system")
+        assert summary.loc["multi_agent", "micro_precision"] == 1.0
+        assert summary.loc["multi_agent", "micro_recall"] == 0.75
+        assert summary.loc["rule_based_system", "micro_f1"] == 0.0
@@ -0,0 +1,95 @@
+"""Unit tests for the columnar result store."""
+
+import pytest
+from src.agents.base import AgentOutput
+from src.core.result_store import ResultStore, flatten_output
+
+
+def risk_output(red_flags):
+    """Build a RiskAnalysisAgent output with the given red flags."""
+    return AgentOutput(
+        agent_name="RiskAnalysisAgent",
+        result={
+            "risk_level": "high",
+            "red_flags": red_flags,
+            "liability_gaps": ["No indemnification clause"],
+            "recommendations": [],
+        },
+        confidence=0.8,
+        reasoning="Test reasoning",
+        metadata={"duration_ms": 120.0},
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Store with two contracts across two runs."""
+    store = ResultStore(tmp_path / "results")
+    store.append("run-1", "C-001", {
+        "risk_analysis": risk_output([
+            {"type": "unlimited_liability", "description": "Uncapped", "clause_reference": "3"},
+        ]),
+        "dependency_graph": AgentOutput(
+            agent_name="DependencyGraphAgent",
+            result={"nodes": [], "edges": [
+                {"source": "2", "target": "4", "relationship_type": "triggers", "strength": 0.5},
+            ]},
+            confidence=0.6,
+            reasoning="Edges",
+        ).model_dump(),
+    })
+    store.append("run-1", "C-002", [risk_output(["Late payment penalty"])])
+    store.append("run-2", "C-002", [risk_output([{"type": "unlimited_liability"}])])
+    return store
+
+
+class TestFlattenOutput:
+    """Tests for flattening agent outputs."""
+
+    def test_risk_rows(self):
+        """Test red flags and liability gaps become risk rows."""
+        rows = flatten_output(risk_output(["Auto-renewal"]))
+        categories = [row["category"] for row in rows["risks"]]
+        assert categories == ["red_flag", "liability_gap"]
+        assert rows["risks"][0]["description"] == "Auto-renewal"
+        assert rows["agent_runs"][0]["risk_level"] == "high"
+        assert rows["agent_runs"][0]["duration_ms"] == 120.0
+
+
+class TestResultStore:
+    """Tests for ResultStore."""
+
+    def test_append_is_partitioned(self, store):
+        """Test each append creates part files under run/contract partitions."""
+        partition = store.root / "risks" / "run_id=run-1" / "contract_id=C-001"
+        parts = list(partition.glob("*.parquet"))
+        assert len(parts) == 1
+
+    def test_append_never_overwrites(self, store):
+        """Test repeated appends to the same partition add rows."""
+        store.append("run-1", "C-001", [risk_output([])])
+        runs = store.read("agent_runs", filters=[("contract_id", "==", "C-001")])
+        assert len(runs) == 3
+
+    def test_read_with_filters(self, store):
+        """Test predicate filters on data and partition columns."""
+        edges = store.read("graph_edges", filters=[("relationship_type", "==", "triggers")])
+        assert edges[["source", "target", "run_id", "contract_id"]].values.tolist() == [
+            ["2", "4", "run-1", "C-001"]
+        ]
+
+    def test_contracts_with_risk(self, store):
+        """Test portfolio query for a red flag type."""
+        assert store.contracts_with_risk("unlimited_liability") == ["C-001", "C-002"]
+        assert store.contracts_with_risk("unlimited_liability", run_id="run-1") == ["C-001"]
+
+    def test_read_empty_table(self, tmp_path):
+        """Test reading a table that has no data yet."""
+        frame = ResultStore(tmp_path).read("obligations")
+        assert frame.empty
+        assert "contract_id" in frame.columns
+
+    def test_unknown_table(self, store):
+        """Test unknown table names are rejected."""
+        with pytest.raises(ValueError):
+            store.read("clauses")
@@ -0,0 +1,182 @@
+"""Unit tests for priority scheduling and load shedding."""
+
+import asyncio
+
+import pytest
+from src.core.scheduler import AnalysisScheduler, LoadShedError, Priority
+from src.main import analyze_contract
+
+
+def job(log, name, delay=0.01):
+    """Coroutine function that records when it starts."""
+    async def run():
+        log.append(name)
+        await asyncio.sleep(delay)
+        return name
+    return run
+
+
+class TestAnalysisScheduler:
+    """Tests for AnalysisScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_weighted_fair_sharing(self):
+        """Test interactive jobs get slots in proportion to their weight."""
+        scheduler = AnalysisScheduler(
+            max_concurrency=2, reserved_slots=0, interactive_slo_seconds=1e9
+        )
+        started = []
+        tasks = [
+            asyncio.create_task(scheduler.submit(job(started, f"b{i}"), Priority.BULK))
+            for i in range(6)
+        ] + [
+            asyncio.create_task(scheduler.submit(job(started, f"i{i}"), Priority.INTERACTIVE))
+            for i in range(8)
+        ]
+        await asyncio.gather(*tasks)
+
+        # First two bulk jobs grabbed the free slots; afterwards 4:1 in favour of interactive
+        assert started[:8] == ["b0", "b1", "i0", "i1", "i2", "i3", "i4", "b2"]
+        assert len(started) == 14
+
+    @pytest.mark.asyncio
+    async def test_reserved_slot_kept_for_interactive(self):
+        """Test bulk jobs never occupy the reserved slots."""
+        scheduler = AnalysisScheduler(
+            max_concurrency=2, reserved_slots=1, interactive_slo_seconds=1e9
+        )
+        started = []
+        bulk = [
+            asyncio.create_task(scheduler.submit(job(started, f"b{i}", 0.05), Priority.BULK))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.metrics().classes[Priority.BULK].running == 1
+
+        interactive = await scheduler.submit(job(started, "i0"), Priority.INTERACTIVE)
+        assert interactive == "i0"
+        assert started.index("i0") == 1
+        await asyncio.gather(*bulk)
+
+    @pytest.mark.asyncio
+    async def test_bulk_rejected_when_slo_at_risk(self):
+        """Test bulk work is shed while interactive backlog exceeds the SLO."""
+        scheduler = AnalysisScheduler(
+            max_concurrency=2,
+            interactive_slo_seconds=1.0,
+            shed_policy="reject",
+            initial_service_seconds=1.0,
+        )
+        started = []
+        interactive = [
+            asyncio.create_task(scheduler.submit(job(started, f"i{i}"), Priority.INTERACTIVE))
+            for i in range(4)
+        ]
+        await asyncio.sleep(0)
+
+        with pytest.raises(LoadShedError):
+            await scheduler.submit(job(started, "b0"), Priority.BULK)
+        await asyncio.gather(*interactive)
+
+        metrics = scheduler.metrics()
+        assert metrics.classes[Priority.BULK].shed == 1
+        assert "b0" not in started
+
+    @pytest.mark.asyncio
+    async def test_bulk_deferred_until_backlog_drains(self):
+        """Test deferred bulk work runs after the interactive backlog."""
+        scheduler = AnalysisScheduler(
+            max_concurrency=2,
+            interactive_slo_seconds=1.0,
+            shed_policy="defer",
+            initial_service_seconds=1.0,
+        )
+        started = []
+        interactive = [
+            asyncio.create_task(scheduler.submit(job(started, f"i{i}"), Priority.INTERACTIVE))
+            for i in range(4)
+        ]
+        await asyncio.sleep(0)
+        bulk = asyncio.create_task(scheduler.submit(job(started, "b0"), Priority.BULK))
+        await asyncio.sleep(0)
+        assert scheduler.metrics().classes[Priority.BULK].deferred == 1
+
+        assert await bulk == "b0"
+        await asyncio.gather(*interactive)
+        assert started.index("b0") > started.index("i1")
+        assert scheduler.metrics().classes[Priority.BULK].deferred_total == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_deadline(self):
+        """Test bulk jobs that cannot meet their deadline are rejected."""
+        scheduler = AnalysisScheduler(initial_service_seconds=5.0)
+        with pytest.raises(LoadShedError):
+            await scheduler.submit(job([], "b0"), Priority.BULK, deadline_seconds=1.0)
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self):
+        """Test job exceptions reach the caller and free the slot."""
+        scheduler = AnalysisScheduler(max_concurrency=1, reserved_slots=0)
+
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await scheduler.submit(fail)
+        assert scheduler.running == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_frees_slot(self):
+        """Test cancelling the caller cancels the running job and frees its slot."""
+        scheduler = AnalysisScheduler(max_concurrency=2, reserved_slots=1)
+        started = []
+        caller = asyncio.create_task(scheduler.submit(job(started, "i0", delay=10)))
+        await asyncio.sleep(0.01)
+        assert scheduler.running == 1
+
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+
+        assert scheduler.running == 0
+        assert scheduler.metrics().classes[Priority.INTERACTIVE].cancelled == 1
+        assert not scheduler._tasks
+
+    @pytest.mark.asyncio
+    async def test_analyze_contract_through_scheduler(self):
+        """Test analyze_contract routes agent calls through the scheduler."""
+        scheduler = AnalysisScheduler(max_concurrency=2)
+        results = await analyze_contract("1. SERVICES\nTerms.", scheduler=scheduler)
+
+        assert "risk_analysis" in results
+        assert scheduler.metrics().classes[Priority.INTERACTIVE].completed == len(results)
+
+    @pytest.mark.asyncio
+    async def test_bulk_contract_admitted_as_a_whole(self):
+        """Test a contract is shed with all its agent calls, none left running."""
+        scheduler = AnalysisScheduler(initial_service_seconds=1.0)
+        with pytest.raises(LoadShedError):
+            await analyze_contract(
+                "1. SERVICES\nTerms.",
+                scheduler=scheduler,
+                priority="bulk",
+                deadline_seconds=1.2,
+            )
+
+        bulk = scheduler.metrics().classes[Priority.BULK]
+        assert bulk.admitted == 0
+        assert bulk.shed == 4
+        assert scheduler.running == 0
+
+    @pytest.mark.asyncio
+    async def test_submit_group_returns_results_in_order(self):
+        """Test grouped jobs all run and keep their order."""
+        scheduler = AnalysisScheduler(max_concurrency=2, reserved_slots=1)
+        started = []
+        results = await scheduler.submit_group(
+            [job(started, "b0"), job(started, "b1")], Priority.BULK
+        )
+
+        assert results == ["b0", "b1"]
+        assert scheduler.metrics().classes[Priority.BULK].completed == 2
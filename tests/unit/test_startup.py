@@ -0,0 +1,40 @@
+"""Startup time checks for the application entry point."""
+
+from src.core.startup import (
+    HEAVY_MODULES,
+    STARTUP_BUDGET_MS,
+    parse_importtime,
+    profile_imports,
+)
+
+
+IMPORTTIME_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:       300 |        420 |   src.core
+import time:       500 |        920 | src.main
+"""
+
+
+class TestStartup:
+    """Tests for import-time behaviour of src.main."""
+
+    def test_parse_importtime(self):
+        """Test importtime lines are parsed with nesting depth."""
+        timings = parse_importtime(IMPORTTIME_SAMPLE)
+        assert [(t.module, t.depth) for t in timings] == [
+            ("_io", 2), ("src.core", 1), ("src.main", 0)
+        ]
+        assert timings[-1].cumulative_us == 920
+
+    def test_no_heavy_modules_at_import(self):
+        """Test SDKs, settings and agents are not loaded by importing src.main."""
+        profile = profile_imports("src.main")
+        assert profile.imported(HEAVY_MODULES) == []
+        assert profile.imported(["src.agents", "src.core.config"]) == []
+
+    def test_import_within_budget(self):
+        """Test cold import of src.main stays within the startup budget."""
+        # Best of three runs to smooth out scheduler noise
+        best = min(profile_imports("src.main").total_ms for _ in range(3))
+        assert best <= STARTUP_BUDGET_MS